@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Awaitable, Callable
 from typing import ClassVar, Optional
+import bisect
 import dataclasses
+import heapq
 
 from vocode.logger import logger
 
@@ -32,6 +34,19 @@ def filter_autocomplete_items_for_text(
     return [item for item in items if item.insert_text != text]
 
 
+class PrefixIndex:
+    def __init__(self, keys: list[str]) -> None:
+        self._order = sorted(range(len(keys)), key=keys.__getitem__)
+        self._keys = [keys[index] for index in self._order]
+
+    def search(self, prefix: str, limit: int) -> list[int]:
+        lo = bisect.bisect_left(self._keys, prefix)
+        hi = bisect.bisect_right(
+            self._keys, prefix, lo=lo, key=lambda key: key[: len(prefix)]
+        )
+        return heapq.nsmallest(limit, self._order[lo:hi])
+
+
 class AutocompleteManager:
     _default_providers: ClassVar[list[AutocompleteProvider]] = []
 
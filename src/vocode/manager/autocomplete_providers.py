@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
 from vocode.logger import logger
-from .autocomplete import AutocompleteManager, AutocompleteItem
+from .autocomplete import AutocompleteManager, AutocompleteItem, PrefixIndex
 from vocode import settings as vocode_settings
 from .commands import auth as auth_commands
 from .commands import mcp as mcp_commands
@@ -77,11 +77,27 @@ def _filesystem_autocomplete_items(
     needle: str,
     start: int,
     word: str,
+    prefix_index: Optional[PrefixIndex] = None,
 ) -> list[AutocompleteItem]:
     normalized_needle = needle.replace("\\", "/").lstrip("./")
     if not normalized_needle:
         return []
 
+    if prefix_index is not None:
+        indexes = prefix_index.search(
+            normalized_needle.casefold(), FILESYSTEM_AUTOCOMPLETE_LIMIT
+        )
+        if len(indexes) >= FILESYSTEM_AUTOCOMPLETE_LIMIT:
+            return [
+                AutocompleteItem(
+                    title=paths[index],
+                    replace_start=start,
+                    replace_text=word,
+                    insert_text=paths[index],
+                )
+                for index in indexes
+            ]
+
     matches: list[tuple[int, str]] = []
     for rel_path in paths:
         score = _score_filesystem_candidate(rel_path, normalized_needle)
@@ -175,12 +191,13 @@ async def file_autocomplete_provider(
         project = server.manager.project
         items = await _know_autocomplete_items(server, needle, start, word)
         if items is None:
-            paths = await server.file_path_cache.get_paths()
+            paths, prefix_index = await server.file_path_cache.get_prefix_index()
             items = _filesystem_autocomplete_items(
                 paths,
                 needle,
                 start,
                 word,
+                prefix_index,
             )
         return _filter_noop(text, items) or None
     except Exception as exc:  # pragma: no cover - defensive logging
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import re
 import shlex
 import typing
 
@@ -78,6 +80,24 @@ class DeclarativeCommand:
         self.description = description
         self.param_names = list(param_names) if param_names is not None else None
         self.hidden = hidden
+        self._meta: _CommandMeta | None = None
+
+    async def invoke(self, server: UIServer, args: typing.Sequence[str]) -> None:
+        values = self._parse_params(args)
+        await self.handler(server, *values)
+
+    def get_meta(self) -> _CommandMeta:
+        if self._meta is None:
+            if self.param_names is None:
+                params = [spec.name for spec in self.params]
+            else:
+                params = list(self.param_names)
+            self._meta = _CommandMeta(
+                description=self.description,
+                params=params,
+                hidden=self.hidden,
+            )
+        return self._meta
 
     def _parse_params(self, args: typing.Sequence[str]) -> list[typing.Any]:
         tokens = list(args)
@@ -132,29 +152,23 @@ CommandHandler = typing.Callable[["UIServer", list[str]], typing.Awaitable[None]
 _GLOBAL_COMMANDS: dict[str, DeclarativeCommand] = {}
 
 
+_find_shlex_special = re.compile(r"[\"'\\]|[^\S \t\r\n]").search
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_argv(raw: str) -> tuple[str, ...]:
+    if _find_shlex_special(raw) is None:
+        return tuple(raw.split())
+    return tuple(shlex.split(raw, posix=True))
+
+
 class CommandManager:
     def __init__(self) -> None:
         self._commands: dict[str, CommandInvoker] = {}
         self._metadata: dict[str, _CommandMeta] = {}
         for name, decl in _GLOBAL_COMMANDS.items():
-            if name not in self._commands:
-                self._commands[name] = self._build_invoker(decl)
-                if decl.param_names is None:
-                    params = [spec.name for spec in decl.params]
-                else:
-                    params = list(decl.param_names)
-                self._metadata[name] = _CommandMeta(
-                    description=decl.description,
-                    params=params,
-                    hidden=decl.hidden,
-                )
-
-    def _build_invoker(self, decl: DeclarativeCommand) -> CommandInvoker:
-        async def invoker(server: UIServer, args: typing.Sequence[str]) -> None:
-            values = decl._parse_params(args)
-            await decl.handler(server, *values)
-
-        return invoker
+            self._commands[name] = decl.invoke
+            self._metadata[name] = decl.get_meta()
 
     async def register(
         self,
@@ -238,7 +252,7 @@ class CommandManager:
         if not args.strip():
             return []
         try:
-            return shlex.split(args, posix=True)
+            return list(_split_argv(args))
         except ValueError as exc:
             raise CommandError(f"Invalid command arguments: {exc}.") from exc
 
@@ -247,13 +261,13 @@ class CommandManager:
         if not raw:
             return None
         try:
-            tokens = shlex.split(raw, posix=True)
+            tokens = _split_argv(raw)
         except ValueError as exc:
             raise CommandError(f"Invalid command syntax: {exc}.") from exc
         if not tokens:
             return None
         name = tokens[0]
-        args = tokens[1:]
+        args = list(tokens[1:])
         raw_args = raw[len(name) :].lstrip()
         return name, args, raw_args
 
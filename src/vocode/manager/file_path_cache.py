@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Callable, Optional
 
 from vocode.logger import logger
+from .autocomplete import PrefixIndex
 
 
 class FilePathCacheService:
@@ -27,6 +28,7 @@ class FilePathCacheService:
         self._time_fn = time_fn or time.monotonic
         self._condition = threading.Condition()
         self._cached_paths: list[str] = []
+        self._cached_index: Optional[PrefixIndex] = None
         self._last_refresh_at: Optional[float] = None
         self._refresh_generation = 0
         self._refresh_requested = False
@@ -44,15 +46,30 @@ class FilePathCacheService:
 
     def get_paths_blocking(self) -> list[str]:
         with self._condition:
-            refresh_generation = self._refresh_generation
-            if self._needs_refresh_locked():
-                if not self._refresh_requested and not self._refresh_in_progress:
-                    self._refresh_requested = True
-                    self._condition.notify_all()
-                while self._refresh_generation == refresh_generation:
-                    self._condition.wait()
+            self._wait_for_refresh_locked()
             return list(self._cached_paths)
 
+    async def get_prefix_index(self) -> tuple[list[str], PrefixIndex]:
+        return await asyncio.to_thread(self.get_prefix_index_blocking)
+
+    def get_prefix_index_blocking(self) -> tuple[list[str], PrefixIndex]:
+        with self._condition:
+            self._wait_for_refresh_locked()
+            if self._cached_index is None:
+                self._cached_index = PrefixIndex(
+                    [path.casefold() for path in self._cached_paths]
+                )
+            return self._cached_paths, self._cached_index
+
+    def _wait_for_refresh_locked(self) -> None:
+        refresh_generation = self._refresh_generation
+        if self._needs_refresh_locked():
+            if not self._refresh_requested and not self._refresh_in_progress:
+                self._refresh_requested = True
+                self._condition.notify_all()
+            while self._refresh_generation == refresh_generation:
+                self._condition.wait()
+
     def shutdown(self) -> None:
         with self._condition:
             self._stopped = True
@@ -74,13 +91,14 @@ class FilePathCacheService:
                 self._refresh_requested = False
                 self._refresh_in_progress = True
             try:
-                paths = self._walker(self._base_path, self._skip_dirs)
+                paths = sorted(self._walker(self._base_path, self._skip_dirs))
             except Exception as exc:
                 logger.exception("file path cache refresh failed", exc=exc)
                 paths = None
             with self._condition:
                 if paths is not None:
                     self._cached_paths = paths
+                    self._cached_index = None
                 self._last_refresh_at = self._time_fn()
                 self._refresh_in_progress = False
                 self._refresh_generation += 1
@@ -32,11 +32,10 @@ class InMemoryEndpoint(BaseEndpoint):
     async def send(self, envelope: BasePacketEnvelope) -> None:
         if self._peer is None:
             raise RuntimeError("Endpoint has no peer")
-        await self._peer._incoming.put(envelope)
+        self._peer._incoming.put_nowait(envelope)
 
     async def recv(self) -> BasePacketEnvelope:
-        envelope = await self._incoming.get()
-        return envelope
+        return await self._incoming.get()
 
 
 class RpcHelper:
@@ -161,6 +161,8 @@ def _prepare_data_and_collect_bindings(
     specs: List[_BindingSpec],
 ) -> Any:
     if isinstance(obj, str):
+        if "${" not in obj:
+            return obj
         m = VAR_PATTERN.fullmatch(obj)
         if m:
             name = m.group(1)
@@ -373,6 +373,10 @@ class InputComponent(tui_base.Component):
         self._editor.insert_text(text)
         self._mark_dirty()
 
+    def replace_range(self, row: int, start: int, end: int, text: str) -> None:
+        self._editor.replace_range(row, start, end, text)
+        self._mark_dirty()
+
     def on_key_event(self, event: input_base.KeyEvent) -> None:
         if event.action != "down":
             return
@@ -263,6 +263,22 @@ class TextEditor:
         self._cursor_col = len(last)
         self._emit_cursor_event(previous_row, previous_col)
 
+    def replace_range(self, row: int, start: int, end: int, text: str) -> None:
+        if row < 0 or row >= len(self._lines):
+            return
+        previous_row = self._cursor_row
+        previous_col = self._cursor_col
+        line = self._lines[row]
+        start = max(0, min(start, len(line)))
+        end = max(start, min(end, len(line)))
+        self._lines[row] = line[:start] + line[end:]
+        self._cursor_row = row
+        self._cursor_col = start
+        if not text:
+            self._emit_cursor_event(previous_row, previous_col)
+            return
+        self.insert_text(text)
+
     def backspace(self) -> None:
         if self._cursor_row == 0 and self._cursor_col == 0:
             return
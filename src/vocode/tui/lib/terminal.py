@@ -130,6 +130,9 @@ class Terminal:
     def components(self):
         return self._components
 
+    def has_component(self, component: tui_base.Component) -> bool:
+        return component in self._component_set
+
     def append_component(self, component: tui_base.Component) -> None:
         if component in self._component_set:
             return
@@ -760,7 +763,8 @@ class Terminal:
 
     async def render(self) -> None:
         if self._screens:
-            self._full_render()
+            with self._console:
+                self._full_render()
             self._width = self._console.size.width
             self._dirty_components.clear()
             return
@@ -786,12 +790,13 @@ class Terminal:
 
         repaint_all = self._width is not None and self._width != width
 
-        if self._width is None or self._force_full_render or self._width != width:
-            self._full_render(repaint_all=repaint_all)
-        else:
-            handled = self._incremental_render(changed_components)
-            if not handled:
-                self._full_render()
+        with self._console:
+            if self._width is None or self._force_full_render or self._width != width:
+                self._full_render(repaint_all=repaint_all)
+            else:
+                handled = self._incremental_render(changed_components)
+                if not handled:
+                    self._full_render()
 
         self._width = width
         self._force_full_render = False
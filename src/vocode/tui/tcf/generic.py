@@ -13,6 +13,9 @@ from vocode.tui.lib import terminal as tui_terminal
 from vocode.tui.tcf import render_utils as tcf_render_utils
 
 
+RENDERED_ARGUMENTS_CACHE_SIZE: typing.Final[int] = 256
+
+
 class _GenericToolCallFormatterOptions(pydantic.BaseModel):
     max_pairs: int = 6
     max_value_chars: int = 80
@@ -23,6 +26,9 @@ class _GenericToolCallFormatterOptions(pydantic.BaseModel):
 
 @tui_tcf.ToolCallFormatterManager.register("generic")
 class GenericToolCallFormatter(tui_tcf.BaseToolCallFormatter):
+    def __init__(self) -> None:
+        self._rendered_arguments: dict[tuple[str, int, int], list[tuple[str, str]]] = {}
+
     def _parse_options(
         self, config: vocode_settings.ToolCallFormatter | None
     ) -> tuple[_GenericToolCallFormatterOptions, str | None]:
@@ -38,6 +44,50 @@ class GenericToolCallFormatter(tui_tcf.BaseToolCallFormatter):
             msg, _ = tcf_render_utils.truncate_to_width(msg, 120)
             return _GenericToolCallFormatterOptions(), msg
 
+    def _render_argument_pairs(
+        self,
+        call_id: str,
+        arguments: typing.Any,
+        max_pairs: int,
+        max_value_chars: int,
+    ) -> list[tuple[str, str]]:
+        if arguments is None:
+            return []
+        cache_key = (call_id, max_pairs, max_value_chars)
+        if call_id:
+            cached = self._rendered_arguments.get(cache_key)
+            if cached is not None:
+                return cached
+
+        raw_pairs: list[tuple[str, typing.Any]] = []
+        if isinstance(arguments, dict):
+            for k, v in arguments.items():
+                raw_pairs.append((str(k), v))
+        else:
+            raw_pairs.append(("args", arguments))
+
+        if max_pairs > 0:
+            raw_pairs = raw_pairs[:max_pairs]
+
+        rendered_pairs: list[tuple[str, str]] = []
+        for k, v in raw_pairs:
+            rendered_v = tcf_render_utils.to_single_line(
+                tcf_render_utils.stringify_value(v)
+            )
+            if tcf_render_utils.cell_len(rendered_v) > max_value_chars:
+                rendered_v, _ = tcf_render_utils.truncate_to_width(
+                    rendered_v,
+                    max_value_chars,
+                )
+            rendered_pairs.append((k, rendered_v))
+
+        if call_id:
+            cache = self._rendered_arguments
+            if len(cache) >= RENDERED_ARGUMENTS_CACHE_SIZE:
+                cache.pop(next(iter(cache)))
+            cache[cache_key] = rendered_pairs
+        return rendered_pairs
+
     def render(
         self,
         terminal: tui_terminal.Terminal,
@@ -47,9 +97,11 @@ class GenericToolCallFormatter(tui_tcf.BaseToolCallFormatter):
         config: vocode_settings.ToolCallFormatter | None,
     ) -> tui_base.Renderable | None:
         tool_name = ""
+        call_id = ""
         arguments: typing.Any = None
         if req is not None:
             tool_name = req.name
+            call_id = req.id
             arguments = req.arguments
         elif resp is not None:
             tool_name = resp.name
@@ -64,27 +116,12 @@ class GenericToolCallFormatter(tui_tcf.BaseToolCallFormatter):
         max_value_chars = options.max_value_chars
         min_value_chars = options.min_value_chars
 
-        raw_pairs: list[tuple[str, typing.Any]] = []
-        if isinstance(arguments, dict):
-            for k, v in arguments.items():
-                raw_pairs.append((str(k), v))
-        elif arguments is not None:
-            raw_pairs.append(("args", arguments))
-
-        if max_pairs > 0:
-            raw_pairs = raw_pairs[:max_pairs]
-
-        rendered_pairs: list[tuple[str, str]] = []
-        for k, v in raw_pairs:
-            rendered_v = tcf_render_utils.to_single_line(
-                tcf_render_utils.stringify_value(v)
-            )
-            if tcf_render_utils.cell_len(rendered_v) > max_value_chars:
-                rendered_v, _ = tcf_render_utils.truncate_to_width(
-                    rendered_v,
-                    max_value_chars,
-                )
-            rendered_pairs.append((k, rendered_v))
+        rendered_pairs = self._render_argument_pairs(
+            call_id,
+            arguments,
+            max_pairs,
+            max_value_chars,
+        )
 
         joiner = ", "
         suffix_text = ""
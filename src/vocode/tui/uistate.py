@@ -43,6 +43,7 @@ from vocode.runner.executors.llm.compaction import CompactionSummaryState
 AUTOCOMPLETE_DEBOUNCE_MS: typing.Final[int] = 100
 PROGRESS_VISIBILITY_DELAY_S: typing.Final[float] = 2.0
 HISTORY_SEARCH_MAX_ITEMS: typing.Final[int] = 20
+DEFAULT_COLLAPSE_LINES: typing.Final[int] = 10
 
 
 class ActionKind(str, enum.Enum):
@@ -52,7 +53,7 @@ class ActionKind(str, enum.Enum):
     HISTORY_SEARCH = "history_search"
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ActionItem:
     kind: ActionKind
     component: tui_terminal.Component
@@ -86,9 +87,9 @@ class TUIState:
         on_autocomplete_request: (
             typing.Callable[[str, int, int], typing.Awaitable[None]] | None
         ) = None,
-        on_open_logs: typing.Callable[[], typing.Awaitable[None]] | None = None,
-        on_stop: typing.Callable[[], typing.Awaitable[None]] | None = None,
-        on_eof: typing.Callable[[], typing.Awaitable[None]] | None = None,
+        on_open_logs: typing.Callable[[], typing.Awaitable[None] | None] | None = None,
+        on_stop: typing.Callable[[], typing.Awaitable[None] | None] | None = None,
+        on_eof: typing.Callable[[], typing.Awaitable[None] | None] | None = None,
         tui_options: vocode_settings.TUIOptions | None = None,
         history_path: Path | None = None,
         persist_history: bool = False,
@@ -98,6 +99,10 @@ class TUIState:
         self._on_open_logs = on_open_logs
         self._on_stop = on_stop
         self._on_eof = on_eof
+        self._console = console
+        self._tui_options = tui_options
+        self._history_path = history_path
+        self._persist_history = persist_history
         self._markdown_render_mode = (
             tui_markdown_component.MarkdownRenderMode.RICH_MARKDOWN
         )
@@ -113,12 +118,64 @@ class TUIState:
             input_handler = input_handler_mod.PosixInputHandler()
         self._input_handler = input_handler
         self._input_task: asyncio.Task[None] | None = None
+        self._callback_tasks: set[asyncio.Task[None]] = set()
+        self._built: bool = False
+
+        self._step_components: dict[
+            str, tui_step_output_component.StepOutputComponent
+        ] = {}
+        self._step_component_ids: set[str] = set()
+        self._alerted_execution_ids: set[str] = set()
+
+        self._progress_component: progress_component.ProgressComponent | None = None
+
+        if self._input_handler is not None:
+            self._input_handler.subscribe(self._handle_input_event)
+
+        self._autocomplete_task: asyncio.Task[None] | None = None
+        self._last_autocomplete_text: str | None = None
+        self._last_autocomplete_row: int | None = None
+        self._last_autocomplete_col: int | None = None
+        self._autocomplete_pending: bool = False
+        self._autocomplete_items: list[manager_proto.AutocompleteItem] | None = None
+        self._ui_state: manager_proto.UIServerStatePacket | None = None
+
+        self._progress_by_id: dict[str, manager_proto.ProgressPacket] = {}
+        self._progress_visible_by_id: set[str] = set()
+        self._progress_gate_tasks: dict[str, asyncio.Task[None]] = {}
+        self._active_progress_id: str | None = None
+
+        self._history_search_query: str = ""
+        self._history_search_list: typing.Optional[
+            tui_select_list.SelectListComponent
+        ] = None
+        self._history_search_query_view: typing.Optional[
+            tui_rich_text_component.RichTextComponent
+        ] = None
+
+        self._exit_pending: bool = False
+
+        self._progressive_hotkey: tui_input_component.KeyBinding | None = None
+        self._progressive_count: int = 0
+
+        self._progressive_keybindings: set[tui_input_component.KeyBinding] = {
+            tui_input_component.KeyBinding("e"),
+            tui_input_component.KeyBinding("c"),
+        }
+
+        self._suppress_history_update: int = 0
+
+    def _ensure_built(self) -> None:
+        if self._built:
+            return
+        self._built = True
+        tui_options = self._tui_options
         if tui_options is None:
             settings = tui_terminal.TerminalSettings()
         else:
             settings = tui_terminal.TerminalSettings(tui=tui_options)
         self._terminal = tui_terminal.Terminal(
-            console=console,
+            console=self._console,
             settings=settings,
         )
 
@@ -142,25 +199,13 @@ class TUIState:
             history_limit = tui_options.history_limit
         self._history_manager = tui_history.HistoryManager(
             max_entries=history_limit,
-            history_path=history_path,
-            persist_history=persist_history,
+            history_path=self._history_path,
+            persist_history=self._persist_history,
         )
         self._input_keymap = self._create_input_keymap()
-        self._step_components: dict[
-            str, tui_step_output_component.StepOutputComponent
-        ] = {}
-        self._step_component_ids: set[str] = set()
-        self._alerted_execution_ids: set[str] = set()
-        self._step_handlers: dict[
-            vocode_state.StepType, typing.Callable[[vocode_state.Step], None]
-        ] = {
-            vocode_state.StepType.OUTPUT_MESSAGE: self._handle_output_message_step,
-            vocode_state.StepType.INPUT_MESSAGE: self._handle_input_message_step,
-            vocode_state.StepType.CONTEXT_COMPACTION: self._handle_context_compaction_step,
-            vocode_state.StepType.REJECTION: self._handle_rejection_step,
-            vocode_state.StepType.PROMPT: self._handle_prompt_step,
-            vocode_state.StepType.PROMPT_CONFIRM: self._handle_prompt_step,
-            vocode_state.StepType.TOOL_REQUEST: self._handle_tool_request_step,
+        self._command_manager_keymap = {
+            hotkey.mapping: hotkey.handler
+            for hotkey in self._build_command_manager_hotkeys()
         }
 
         self._terminal.append_component(header)
@@ -173,8 +218,6 @@ class TUIState:
         self._toolbar_component = toolbar
         self._terminal.append_component(toolbar)
 
-        self._progress_component: progress_component.ProgressComponent | None = None
-
         self._action_stack: list[ActionItem] = [
             ActionItem(kind=ActionKind.DEFAULT, component=toolbar)
         ]
@@ -185,42 +228,6 @@ class TUIState:
         self._input_component.subscribe_cursor_event(self._handle_cursor_event)
         self._input_component.subscribe_change(self._handle_change)
 
-        if self._input_handler is not None:
-            self._input_handler.subscribe(self._handle_input_event)
-
-        self._autocomplete_task: asyncio.Task[None] | None = None
-        self._last_autocomplete_text: str | None = None
-        self._last_autocomplete_row: int | None = None
-        self._last_autocomplete_col: int | None = None
-        self._autocomplete_pending: bool = False
-        self._autocomplete_items: list[manager_proto.AutocompleteItem] | None = None
-        self._ui_state: manager_proto.UIServerStatePacket | None = None
-
-        self._progress_by_id: dict[str, manager_proto.ProgressPacket] = {}
-        self._progress_visible_by_id: set[str] = set()
-        self._progress_gate_tasks: dict[str, asyncio.Task[None]] = {}
-        self._active_progress_id: str | None = None
-
-        self._history_search_query: str = ""
-        self._history_search_list: typing.Optional[
-            tui_select_list.SelectListComponent
-        ] = None
-        self._history_search_query_view: typing.Optional[
-            tui_rich_text_component.RichTextComponent
-        ] = None
-
-        self._exit_pending: bool = False
-
-        self._progressive_hotkey: tui_input_component.KeyBinding | None = None
-        self._progressive_count: int = 0
-
-        self._progressive_keybindings: set[tui_input_component.KeyBinding] = {
-            tui_input_component.KeyBinding("e"),
-            tui_input_component.KeyBinding("c"),
-        }
-
-        self._suppress_history_update: int = 0
-
     def _render_banner(
         self, console: rich_console.Console
     ) -> rich_console.RenderableType:
@@ -237,10 +244,17 @@ class TUIState:
 
     @property
     def terminal(self) -> tui_terminal.Terminal:
+        self._ensure_built()
         return self._terminal
 
+    @property
+    def input_component(self) -> tui_input_component.InputComponent:
+        self._ensure_built()
+        return self._input_component
+
     @property
     def history(self) -> tui_history.HistoryManager:
+        self._ensure_built()
         return self._history_manager
 
     @property
@@ -289,20 +303,18 @@ class TUIState:
                 self._pop_action(ActionKind.COMMAND_MANAGER)
                 return True
 
-            # TODO: Optimize
-            hotkeys = self._build_command_manager_hotkeys()
             binding = tui_input_component.KeyBinding(
                 key=event.key,
                 ctrl=event.ctrl,
                 alt=event.alt,
                 shift=event.shift,
             )
-            for hotkey in hotkeys:
-                if hotkey.mapping == binding:
-                    handled = hotkey.handler(event)
-                    self._pop_action(ActionKind.COMMAND_MANAGER)
-                    return handled
-            return True
+            handler = self._command_manager_keymap.get(binding)
+            if handler is None:
+                return True
+            handled = handler(event)
+            self._pop_action(ActionKind.COMMAND_MANAGER)
+            return handled
 
         binding = tui_input_component.KeyBinding(
             key=event.key,
@@ -676,12 +688,22 @@ class TUIState:
         self._exit_pending = False
         self._update_toolbar_from_ui_state()
 
+    def _run_callback(
+        self, callback: typing.Callable[[], typing.Awaitable[None] | None]
+    ) -> None:
+        result = callback()
+        if not asyncio.iscoroutine(result):
+            return
+        task = asyncio.create_task(result)
+        self._callback_tasks.add(task)
+        task.add_done_callback(self._callback_tasks.discard)
+
     def _handle_stop(self, event: input_base.KeyEvent) -> bool:
         _ = event
         self._cancel_exit_pending()
         if self._on_stop is None:
             return False
-        asyncio.create_task(self._on_stop())
+        self._run_callback(self._on_stop)
         return True
 
     def _apply_progressive_collapse(
@@ -694,16 +716,9 @@ class TUIState:
         if len(components) <= 3:
             return False
 
-        message_components = components[1:-2]
-        if not message_components:
-            return False
-
-        filtered: list[tui_terminal.Component] = []
-        for component in message_components:
-            if not component.supports_collapse:
-                continue
-            filtered.append(component)
-
+        filtered: list[tui_terminal.Component] = [
+            component for component in components[1:-2] if component.supports_collapse
+        ]
         if not filtered:
             return False
 
@@ -750,14 +765,14 @@ class TUIState:
             return True
         self._exit_pending = False
         self._update_toolbar_from_ui_state()
-        asyncio.create_task(self._on_eof())
+        self._run_callback(self._on_eof)
         return True
 
     def _handle_open_logs(self, event: input_base.KeyEvent) -> bool:
         _ = event
         if self._on_open_logs is None:
             return False
-        asyncio.create_task(self._on_open_logs())
+        self._run_callback(self._on_open_logs)
         return True
 
     def _handle_open_keybindings(self, event: input_base.KeyEvent) -> bool:
@@ -774,6 +789,7 @@ class TUIState:
         return True
 
     def _handle_input_event(self, event: input_base.InputEvent) -> None:
+        self._ensure_built()
         if isinstance(event, input_base.PasteEvent):
             self._cancel_exit_pending()
             text = event.text
@@ -781,6 +797,7 @@ class TUIState:
                 self._input_component.paste_text(text)
             return
 
+        terminal = self._terminal
         if isinstance(event, input_base.KeyEvent):
             binding = tui_input_component.KeyBinding(
                 key=event.key,
@@ -788,34 +805,34 @@ class TUIState:
                 alt=event.alt,
                 shift=event.shift,
             )
-            if event.action == "down" and binding in self._progressive_keybindings:
-                if self._progressive_hotkey == binding:
-                    self._progressive_count += 1
-                else:
-                    self._progressive_hotkey = binding
-                    self._progressive_count = 1
-            elif event.action == "down":
-                if binding.key in ("esc", "escape"):
+            if event.action == "down":
+                key = binding.key
+                if binding in self._progressive_keybindings:
+                    if self._progressive_hotkey == binding:
+                        self._progressive_count += 1
+                    else:
+                        self._progressive_hotkey = binding
+                        self._progressive_count = 1
+                elif key in ("esc", "escape"):
                     pass
-                elif binding.key == "space" and binding.ctrl:
+                elif key == "space" and binding.ctrl:
                     pass
                 else:
                     self._progressive_hotkey = None
                     self._progressive_count = 0
 
-            if event.action == "down":
-                if not (binding.key == "d" and binding.ctrl):
+                if not (key == "d" and binding.ctrl):
                     self._cancel_exit_pending()
 
-            terminal = self._terminal
             if not terminal.has_screens:
                 handled = self._handle_input_key_event(event)
                 if handled:
                     return
 
-        self._terminal._handle_input_event(event)
+        terminal._handle_input_event(event)
 
     async def start(self) -> None:
+        self._ensure_built()
         await self._history_manager.start()
         await self._terminal.start()
         if self._input_handler is not None and self._input_task is None:
@@ -833,6 +850,8 @@ class TUIState:
                 await task
             except asyncio.CancelledError:
                 pass
+        if not self._built:
+            return
         await self._history_manager.stop()
         await self._terminal.stop()
         self._terminal.console.control(rich_control.Control.show_cursor(True))
@@ -843,7 +862,8 @@ class TUIState:
         display: manager_proto.RunnerReqDisplayOpts | None = None,
         component_style: tui_terminal.ComponentStyle | None = None,
     ) -> None:
-        collapse_lines: int = 10
+        self._ensure_built()
+        collapse_lines: int = DEFAULT_COLLAPSE_LINES
         collapsed: bool | None = None
         if display is not None:
             if display.collapse_lines is not None:
@@ -864,6 +884,7 @@ class TUIState:
         component_style: tui_terminal.ComponentStyle | None = None,
         markup: bool = True,
     ) -> None:
+        self._ensure_built()
         component = tui_rich_text_component.RichTextComponent(
             text,
             component_style=component_style,
@@ -925,7 +946,7 @@ class TUIState:
                 existing.component_style = component_style
             return
 
-        collapse_lines: int = 10
+        collapse_lines: int = DEFAULT_COLLAPSE_LINES
         collapsed: bool = False
         if display is not None:
             if display.collapse_lines is not None:
@@ -945,14 +966,6 @@ class TUIState:
         self._step_component_ids.add(step_id)
         self._terminal.insert_component(-2, component)
 
-    def _format_prompt_markdown(self, step: vocode_state.Step) -> str | None:
-        message = step.message
-        if message is None:
-            return None
-        if message.text is None:
-            return None
-        return message.text
-
     def _upsert_markdown_component(
         self,
         step: vocode_state.Step,
@@ -973,7 +986,7 @@ class TUIState:
                 existing.component_style = component_style
             return
 
-        collapse_lines: int = 10
+        collapse_lines: int = DEFAULT_COLLAPSE_LINES
         collapsed: bool = False
         if display is not None:
             if display.collapse_lines is not None:
@@ -1029,19 +1042,13 @@ class TUIState:
         lines = raw.splitlines() if raw else [""]
 
         if prefix and lines:
-            pad = " " * len(prefix)
-            first_line = prefix + lines[0]
-            if len(lines) > 1:
-                rest_lines = [pad + line for line in lines[1:]]
-                all_lines = [first_line, *rest_lines]
-            else:
-                all_lines = [first_line]
-            prefixed = "\n".join(all_lines)
+            separator = "\n" + " " * len(prefix)
+            prefixed = prefix + separator.join(lines)
         else:
             prefixed = "\n".join(lines)
 
         step_id = str(step.id)
-        collapse_lines = 10
+        collapse_lines = DEFAULT_COLLAPSE_LINES
         collapsed = False
         if display is not None:
             if display.collapse_lines is not None:
@@ -1081,7 +1088,7 @@ class TUIState:
         step: vocode_state.Step,
         display: manager_proto.RunnerReqDisplayOpts | None = None,
     ) -> None:
-        markdown = self._format_prompt_markdown(step)
+        markdown = self._format_message_markdown(step)
         if markdown is None:
             return
         self._upsert_markdown_component(
@@ -1102,7 +1109,6 @@ class TUIState:
             raw = message.text.strip()
             if raw:
                 text = raw
-        step_id = str(step.id)
         self._upsert_markdown_component(
             step,
             text,
@@ -1184,6 +1190,7 @@ class TUIState:
         self._upsert_markdown_component(step, markdown)
 
     def handle_step_deleted(self, step_ids: list[str]) -> None:
+        self._ensure_built()
         terminal = self._terminal
         with terminal.suspend_auto_render():
             for step_id in step_ids:
@@ -1203,6 +1210,7 @@ class TUIState:
         step: vocode_state.Step,
         display: manager_proto.RunnerReqDisplayOpts | None = None,
     ) -> None:
+        self._ensure_built()
         if display is not None and display.alert:
             execution_id = str(step.execution_id)
             if execution_id not in self._alerted_execution_ids:
@@ -1219,32 +1227,29 @@ class TUIState:
         elif mode == vocode_models.OutputMode.HIDE_FINAL:
             if step.is_final and step.message is not None:
                 return
-        if step.type == vocode_state.StepType.OUTPUT_MESSAGE:
-            self._handle_output_message_step(step, display=display)
-            return
-        if step.type is vocode_state.StepType.INPUT_MESSAGE:
-            self._handle_input_message_step(step, display=display)
-            return
-        if step.type in (
-            vocode_state.StepType.PROMPT,
-            vocode_state.StepType.PROMPT_CONFIRM,
-        ):
-            self._handle_prompt_step(step, display=display)
-            return
-        handler = self._step_handlers.get(step.type)
-        if handler is not None:
-            if step.type is vocode_state.StepType.TOOL_REQUEST:
+        match step.type:
+            case vocode_state.StepType.OUTPUT_MESSAGE:
+                self._handle_output_message_step(step, display=display)
+            case vocode_state.StepType.INPUT_MESSAGE:
+                self._handle_input_message_step(step, display=display)
+            case vocode_state.StepType.PROMPT | vocode_state.StepType.PROMPT_CONFIRM:
+                self._handle_prompt_step(step, display=display)
+            case vocode_state.StepType.TOOL_REQUEST:
                 self._handle_tool_request_step(step, display=display)
-            else:
-                handler(step)
-            return
-        self._handle_default_step(step)
+            case vocode_state.StepType.CONTEXT_COMPACTION:
+                self._handle_context_compaction_step(step)
+            case vocode_state.StepType.REJECTION:
+                self._handle_rejection_step(step)
+            case _:
+                self._handle_default_step(step)
 
     def handle_ui_state(self, packet: manager_proto.UIServerStatePacket) -> None:
+        self._ensure_built()
         self._ui_state = packet
         self._update_toolbar_from_ui_state()
 
     def handle_progress(self, packet: manager_proto.ProgressPacket) -> None:
+        self._ensure_built()
         pid = packet.progress_id
         if pid is None:
             return
@@ -1345,6 +1350,7 @@ class TUIState:
         title: str | None,
         subtitle: str | None = None,
     ) -> None:
+        self._ensure_built()
         style = self._input_component.component_style
         if style is None:
             style = tui_styles.INPUT_COMPONENT_STYLE
@@ -1452,6 +1458,7 @@ class TUIState:
         self,
         items: list[manager_proto.AutocompleteItem] | None,
     ) -> None:
+        self._ensure_built()
         if self._action_stack[-1].kind is ActionKind.HISTORY_SEARCH:
             return
         self._autocomplete_items = items
@@ -1519,13 +1526,7 @@ class TUIState:
                 self._pop_action(ActionKind.AUTOCOMPLETE)
                 return
 
-            new_line = line[:start] + selected.insert_text + line[end:]
-            all_lines = list(lines)
-            all_lines[row] = new_line
-            self._input_component.text = "\n".join(all_lines)
-            self._input_component.set_cursor_position(
-                row, start + len(selected.insert_text)
-            )
+            self._input_component.replace_range(row, start, end, selected.insert_text)
             self._pop_action(ActionKind.AUTOCOMPLETE)
 
         select.subscribe_select(_on_select)
@@ -1551,8 +1552,8 @@ class TUIState:
             if current_component in terminal._animation_components:
                 current_item.animated = True
 
-        if component is not current_component:
-            if terminal is not None:
+        if component is not current_component and terminal is not None:
+            with terminal.suspend_auto_render():
                 terminal.remove_component(current_component)
                 terminal.append_component(component)
         self._action_stack.append(ActionItem(kind=kind, component=component))
@@ -1564,40 +1565,34 @@ class TUIState:
         top = self._action_stack[-1]
         if kind is not None and top.kind is not kind:
             return
-        terminal = self._terminal
-        if terminal is not None:
-            terminal.remove_component(top.component)
         self._action_stack.pop()
 
         new_top = self._action_stack[-1]
-        self._toolbar_component = new_top.component
+        toolbar = new_top.component
+        self._toolbar_component = toolbar
+
+        terminal = self._terminal
+        if terminal is None:
+            return
+
+        with terminal.suspend_auto_render():
+            terminal.remove_component(top.component)
 
-        if terminal is not None:
             # If the component was removed but not yet purged (deferred removal),
             # we need to ensure it's properly re-attached.
-            if self._toolbar_component.terminal is None:
-                if self._toolbar_component in terminal.components:
-                    terminal.components.remove(self._toolbar_component)
-                    if self._toolbar_component in terminal._component_set:
-                        terminal._component_set.remove(self._toolbar_component)
-                    if self._toolbar_component in terminal._removed_components:
-                        terminal._removed_components.remove(self._toolbar_component)
+            if toolbar.terminal is None and terminal.has_component(toolbar):
+                terminal.components.remove(toolbar)
+                terminal._component_set.discard(toolbar)
+                terminal._removed_components.discard(toolbar)
 
-            if self._toolbar_component not in terminal.components:
-                terminal.append_component(self._toolbar_component)
+            if not terminal.has_component(toolbar):
+                terminal.append_component(toolbar)
 
             if new_top.animated:
-                if isinstance(
-                    self._toolbar_component,
-                    toolbar_component.ToolbarComponent,
-                ):
-                    toolbar = typing.cast(
-                        toolbar_component.ToolbarComponent,
-                        self._toolbar_component,
-                    )
+                if isinstance(toolbar, toolbar_component.ToolbarComponent):
                     toolbar.restore_animation()
                 else:
-                    terminal.register_animation(self._toolbar_component)
+                    terminal.register_animation(toolbar)
 
     def _update_toolbar_from_ui_state(self) -> None:
         toolbar = self._base_toolbar_component
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from typing import Any, List, Tuple, Optional, Dict
+from typing import Any, Callable, List, Tuple, Optional, Dict
+import functools
 import json
 import os
 import re
+import types
+import typing
 
 from pydantic import BaseModel, PrivateAttr, model_validator, TypeAdapter
 
@@ -12,6 +15,46 @@ VAR_PATTERN = re.compile(
     r"(?<!\$)\$\{([A-Za-z_][A-Za-z0-9_]*(?::[A-Za-z_][A-Za-z0-9_]*)?)\}"
 )
 
+_TEMPLATE_PATTERN = re.compile(
+    r"\$\$\{|\$\{([A-Za-z_][A-Za-z0-9_]*(?::[A-Za-z_][A-Za-z0-9_]*)?)\}"
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_template(template: str) -> Tuple[str, ...]:
+    tokens: List[str] = []
+    text: List[str] = []
+    last_end = 0
+    for m in _TEMPLATE_PATTERN.finditer(template):
+        text.append(template[last_end : m.start()])
+        name = m.group(1)
+        if name is None:
+            text.append("${")
+        else:
+            tokens.append("".join(text))
+            tokens.append(name)
+            text = []
+        last_end = m.end()
+    text.append(template[last_end:])
+    tokens.append("".join(text))
+    return tuple(tokens)
+
+
+def _render_template(tokens: Tuple[str, ...], resolve: Callable[[str], str]) -> str:
+    if len(tokens) == 1:
+        return tokens[0]
+    if len(tokens) == 3 and not tokens[0] and not tokens[2]:
+        return resolve(tokens[1])
+    out = list(tokens)
+    resolved: Dict[str, str] = {}
+    for index in range(1, len(tokens), 2):
+        name = tokens[index]
+        value = resolved.get(name)
+        if value is None:
+            value = resolved[name] = resolve(name)
+        out[index] = value
+    return "".join(out)
+
 
 class VarDef(BaseModel):
     value: Any = None
@@ -41,6 +84,8 @@ class VarDef(BaseModel):
 
 
 class VarEnv:
+    __slots__ = ("_vars_map",)
+
     def __init__(self, vars_map: Dict[str, Any]) -> None:
         self._vars_map = vars_map
 
@@ -70,6 +115,8 @@ class VarEnv:
         found, val = self.lookup(name)
         if not found:
             return "${" + name + "}"
+        if type(val) is str:
+            return val
         if val is None:
             return ""
         if isinstance(val, (dict, list)):
@@ -77,14 +124,14 @@ class VarEnv:
         return str(val)
 
     def interpolate(self, template: str) -> str:
-        def repl(m: re.Match) -> str:
-            return self.resolve_placeholder(m.group(1))
-
-        interpolated = VAR_PATTERN.sub(repl, template)
-        return interpolated.replace("$${", "${")
+        if "${" not in template:
+            return template
+        return _render_template(_compile_template(template), self.resolve_placeholder)
 
 
 class VarExpr:
+    __slots__ = ()
+
     def resolve(self) -> Any:
         raise NotImplementedError
 
@@ -93,6 +140,8 @@ class VarExpr:
 
 
 class VarRef(VarExpr):
+    __slots__ = ("_env", "_name")
+
     def __init__(self, env: VarEnv, name: str) -> None:
         self._env = env
         self._name = name
@@ -111,29 +160,15 @@ class VarRef(VarExpr):
 
 
 class VarInterpolated(VarExpr):
+    __slots__ = ("_env", "_template", "_tokens")
+
     def __init__(self, env: VarEnv, template: str) -> None:
         self._env = env
         self._template = template
-        self._parts: List[Tuple[str, str]] = []
-
-        last_end = 0
-        for m in VAR_PATTERN.finditer(template):
-            if m.start() > last_end:
-                self._parts.append(("text", template[last_end : m.start()]))
-            self._parts.append(("var", m.group(1)))
-            last_end = m.end()
-        if last_end < len(template):
-            self._parts.append(("text", template[last_end:]))
+        self._tokens = _compile_template(template)
 
     def resolve(self) -> str:
-        out: List[str] = []
-        for kind, payload in self._parts:
-            if kind == "text":
-                out.append(payload)
-            else:
-                out.append(self._env.resolve_placeholder(payload))
-        result = "".join(out)
-        return result.replace("$${", "${")
+        return _render_template(self._tokens, self._env.resolve_placeholder)
 
     def __repr__(self) -> str:
         return f"VarInterpolated({self._template!r})"
@@ -144,6 +179,48 @@ class VarInterpolated(VarExpr):
         )
 
 
+_INERT_FIELD_TYPES: Tuple[Any, ...] = (int, float, bool, bytes, type(None))
+
+
+def _is_inert_annotation(annotation: Any) -> bool:
+    if annotation in _INERT_FIELD_TYPES:
+        return True
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union or origin is types.UnionType:
+        return all(_is_inert_annotation(arg) for arg in typing.get_args(annotation))
+    return False
+
+
+@functools.lru_cache(maxsize=None)
+def _var_field_names(model_cls: type[BaseModel]) -> Tuple[str, ...]:
+    return tuple(
+        name
+        for name, field_info in model_cls.model_fields.items()
+        if not _is_inert_annotation(field_info.annotation)
+    )
+
+
+class _VarFieldDescriptor:
+    __slots__ = ("_name",)
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __get__(self, obj: Any, owner: Any = None) -> Any:
+        if obj is None:
+            raise AttributeError(self._name)
+        try:
+            value = obj.__dict__[self._name]
+        except KeyError:
+            raise AttributeError(self._name) from None
+        if isinstance(value, VarExpr):
+            return value.resolve()
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        obj.__dict__[self._name] = value
+
+
 class BaseVarModel(BaseModel):
     _var_env: Optional[VarEnv] = PrivateAttr(default=None)
 
@@ -154,50 +231,43 @@ class BaseVarModel(BaseModel):
 
     @classmethod
     def _wrap_value(cls, value: Any, env: VarEnv) -> Any:
-        if isinstance(value, str):
-            if (
-                value.startswith("${")
-                and value.endswith("}")
-                and VAR_PATTERN.fullmatch(value)
-            ):
-                name = value[2:-1]
-                return VarRef(env, name)
-            if VAR_PATTERN.search(value):
-                return VarInterpolated(env, value)
+        if not isinstance(value, str) or "${" not in value:
+            return value
+        if value[:2] == "${" and value[-1:] == "}":
+            m = VAR_PATTERN.fullmatch(value)
+            if m is not None:
+                return VarRef(env, m.group(1))
+        if len(_compile_template(value)) > 1:
+            return VarInterpolated(env, value)
         return value
 
     @classmethod
     def _propagate_var_context(cls, obj: Any, env: VarEnv) -> None:
-        if isinstance(obj, BaseVarModel):
-            BaseModel.__setattr__(obj, "_var_env", env)
-            for field_name, field_info in obj.__class__.model_fields.items():
-                value = getattr(obj, field_name)
-                wrapped = cls._wrap_container(value, env)
-                if wrapped is not value:
-                    BaseModel.__setattr__(obj, field_name, wrapped)
-                cls._propagate_var_context(value, env)
-        elif isinstance(obj, list):
-            for item in obj:
-                cls._propagate_var_context(item, env)
-        elif isinstance(obj, dict):
-            for item in obj.values():
-                cls._propagate_var_context(item, env)
-
-    @classmethod
-    def _wrap_container(cls, value: Any, env: VarEnv) -> Any:
-        if isinstance(value, str):
-            return cls._wrap_value(value, env)
-        if isinstance(value, list):
-            return [cls._wrap_container(v, env) for v in value]
-        if isinstance(value, dict):
-            return {k: cls._wrap_container(v, env) for k, v in value.items()}
-        return value
-
-    def __getattribute__(self, name: str) -> Any:
-        value = super().__getattribute__(name)
-        if isinstance(value, VarExpr):
-            return value.resolve()
-        return value
+        stack: List[Any] = [obj]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, BaseVarModel):
+                BaseModel.__setattr__(node, "_var_env", env)
+                node_cls = node.__class__
+                for field_name in _var_field_names(node_cls):
+                    value = getattr(node, field_name)
+                    if isinstance(value, str):
+                        wrapped = cls._wrap_value(value, env)
+                        if wrapped is not value:
+                            cls._install_var_field(node_cls, field_name)
+                            BaseModel.__setattr__(node, field_name, wrapped)
+                    elif isinstance(value, (BaseVarModel, list, dict)):
+                        stack.append(value)
+            elif isinstance(node, list):
+                stack.extend(node)
+            elif isinstance(node, dict):
+                stack.extend(node.values())
+
+    @staticmethod
+    def _install_var_field(model_cls: type[BaseModel], field_name: str) -> None:
+        if isinstance(model_cls.__dict__.get(field_name), _VarFieldDescriptor):
+            return
+        setattr(model_cls, field_name, _VarFieldDescriptor(field_name))
 
     def __setattr__(self, name: str, value: Any) -> None:
         if name.startswith("_"):
@@ -210,11 +280,15 @@ class BaseVarModel(BaseModel):
 
 
 class VarBindTarget:
+    __slots__ = ()
+
     def set(self, value: Any) -> None:
         raise NotImplementedError
 
 
 class VarBindTargetAttr(VarBindTarget):
+    __slots__ = ("_owner", "_attr_name", "_adapter")
+
     def __init__(self, owner: Any, attr_name: str) -> None:
         self._owner = owner
         self._attr_name = attr_name
@@ -232,6 +306,8 @@ class VarBindTargetAttr(VarBindTarget):
 
 
 class VarBindTargetDictKey(VarBindTarget):
+    __slots__ = ("_owner", "_key")
+
     def __init__(self, owner: Dict[str, Any], key: str) -> None:
         self._owner = owner
         self._key = key
@@ -241,6 +317,8 @@ class VarBindTargetDictKey(VarBindTarget):
 
 
 class VarBindTargetListIndex(VarBindTarget):
+    __slots__ = ("_owner", "_index")
+
     def __init__(self, owner: List[Any], index: int) -> None:
         self._owner = owner
         self._index = index
@@ -250,6 +328,8 @@ class VarBindTargetListIndex(VarBindTarget):
 
 
 class VarBinding:
+    __slots__ = ()
+
     def dependencies(self) -> List[str]:
         raise NotImplementedError
 
@@ -258,6 +338,8 @@ class VarBinding:
 
 
 class VarRefBinding(VarBinding):
+    __slots__ = ("_target", "_name")
+
     def __init__(self, target: VarBindTarget, name: str) -> None:
         self._target = target
         self._name = name
@@ -274,35 +356,16 @@ class VarRefBinding(VarBinding):
 
 
 class VarInterpolatedBinding(VarBinding):
+    __slots__ = ("_target", "_template", "_tokens", "_deps")
+
     def __init__(self, target: VarBindTarget, template: str) -> None:
         self._target = target
         self._template = template
-        self._parts: List[Tuple[str, str]] = []
-        self._deps: List[str] = []
-
-        seen: Dict[str, None] = {}
-        last_end = 0
-        for m in VAR_PATTERN.finditer(template):
-            if m.start() > last_end:
-                self._parts.append(("text", template[last_end : m.start()]))
-            var_name = m.group(1)
-            self._parts.append(("var", var_name))
-            if var_name not in seen:
-                seen[var_name] = None
-                self._deps.append(var_name)
-            last_end = m.end()
-        if last_end < len(template):
-            self._parts.append(("text", template[last_end:]))
+        self._tokens = _compile_template(template)
+        self._deps: List[str] = list(dict.fromkeys(self._tokens[1::2]))
 
     def dependencies(self) -> List[str]:
         return list(self._deps)
 
     def apply(self, env: VarEnv) -> None:
-        out: List[str] = []
-        for kind, payload in self._parts:
-            if kind == "text":
-                out.append(payload)
-            else:
-                out.append(env.resolve_placeholder(payload))
-        result = "".join(out).replace("$${", "${")
-        self._target.set(result)
+        self._target.set(_render_template(self._tokens, env.resolve_placeholder))
@@ -0,0 +1,61 @@
+from typing import Any, Iterator, List, Optional
+
+import connect
+
+
+class FakeStreamHandle:
+    __slots__ = ("_events", "_final_response", "_iter")
+
+    def __init__(
+        self,
+        events: List[connect.StreamEvent],
+        final_response: Optional[connect.AssistantMessage] = None,
+    ) -> None:
+        self._events = events
+        self._final_response = final_response
+        self._iter: Iterator[connect.StreamEvent] = iter(events)
+
+    def __aiter__(self):
+        self._iter = iter(self._events)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+    async def final_response(self) -> connect.AssistantMessage:
+        if self._final_response is not None:
+            return self._final_response
+        for event in reversed(self._events):
+            if event.type == "response_end":
+                return event.response
+        raise RuntimeError("missing final response")
+
+
+class FakeAsyncLLMClient:
+    __slots__ = ("_stream_handle", "kwargs")
+
+    def __init__(self, stream_handle: FakeStreamHandle, **kwargs: Any) -> None:
+        self._stream_handle = stream_handle
+        self.kwargs = kwargs
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
+    def stream(self, model: str, request: Any, options: Any = None):
+        return self._stream_handle
+
+    async def generate(
+        self,
+        model: str,
+        request: Any,
+        provider: Optional[str] = None,
+        options: Any = None,
+    ) -> connect.AssistantMessage:
+        _ = model, request, provider, options
+        return await self._stream_handle.final_response()
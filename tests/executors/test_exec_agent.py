@@ -31,9 +31,7 @@ async def test_run_agent_executor_flow() -> None:
     )
     inp = ExecutorInput(execution=execution, run=run)
 
-    steps: list[state.Step] = []
-    async for step in executor.run(inp):
-        steps.append(step)
+    steps = [step async for step in executor.run(inp)]
 
     assert len(steps) == 1
     step1 = steps[0]
@@ -44,9 +42,7 @@ async def test_run_agent_executor_flow() -> None:
 
     history.upsert_step(run, step1)
 
-    steps_retry: list[state.Step] = []
-    async for step in executor.run(inp):
-        steps_retry.append(step)
+    steps_retry = [step async for step in executor.run(inp)]
 
     assert len(steps_retry) == 1
     step2 = steps_retry[0]
@@ -67,9 +63,7 @@ async def test_run_agent_executor_flow() -> None:
     )
     history.upsert_step(run, result_step)
 
-    steps_final: list[state.Step] = []
-    async for step in executor.run(inp):
-        steps_final.append(step)
+    steps_final = [step async for step in executor.run(inp)]
 
     assert len(steps_final) == 1
     final_step = steps_final[0]
@@ -45,9 +45,7 @@ def test_exec_executor_streaming(tmp_path: Path) -> None:
         executor = ExecExecutor(config=node, project=proj)  # type: ignore[arg-type]
         inp = ExecutorInput(execution=execution, run=run)
 
-        steps: list[state.Step] = []
-        async for step in executor.run(inp):
-            steps.append(step)
+        steps = [step async for step in executor.run(inp)]
 
         assert steps
 
@@ -99,9 +97,7 @@ def test_exec_executor_stdin_literal(tmp_path: Path) -> None:
         executor = ExecExecutor(config=node, project=proj)  # type: ignore[arg-type]
         inp = ExecutorInput(execution=execution, run=run)
 
-        steps: list[state.Step] = []
-        async for step in executor.run(inp):
-            steps.append(step)
+        steps = [step async for step in executor.run(inp)]
 
         final = steps[-1]
         final_text = final.message.text if final.message else ""
@@ -148,9 +144,7 @@ def test_exec_executor_stdin_from_input_message(tmp_path: Path) -> None:
         executor = ExecExecutor(config=node, project=proj)  # type: ignore[arg-type]
         inp = ExecutorInput(execution=execution, run=run)
 
-        steps: list[state.Step] = []
-        async for step in executor.run(inp):
-            steps.append(step)
+        steps = [step async for step in executor.run(inp)]
 
         final = steps[-1]
         final_text = final.message.text if final.message else ""
@@ -29,65 +29,11 @@ from vocode.runner.executors.llm.models import LLMNodeMCPSettings
 from vocode.runner.executors.llm.models import LLMNode
 from vocode.runner.executors.llm import helpers as llm_helpers
 from vocode.runner.base import ExecutorInput
+from tests.executors.llm_stubs import FakeAsyncLLMClient, FakeStreamHandle
 from tests.stub_project import StubProject
 
 
-RECORDED_TOOL_CALLS: List[str] = []  # type: ignore
-
-
-class FakeStreamHandle:
-    def __init__(
-        self,
-        events: List[connect.StreamEvent],
-        final_response: Optional[connect.AssistantMessage] = None,
-    ) -> None:
-        self._events = events
-        self._final_response = final_response
-        self._index = 0
-
-    def __aiter__(self):
-        self._index = 0
-        return self
-
-    async def __anext__(self):
-        if self._index >= len(self._events):
-            raise StopAsyncIteration
-        event = self._events[self._index]
-        self._index += 1
-        return event
-
-    async def final_response(self) -> connect.AssistantMessage:
-        if self._final_response is not None:
-            return self._final_response
-        for event in reversed(self._events):
-            if event.type == "response_end":
-                return event.response
-        raise RuntimeError("missing final response")
-
-
-class FakeAsyncLLMClient:
-    def __init__(self, stream_handle: FakeStreamHandle, **kwargs: Any) -> None:
-        self._stream_handle = stream_handle
-        self.kwargs = kwargs
-
-    async def __aenter__(self):
-        return self
-
-    async def __aexit__(self, exc_type, exc, tb) -> None:
-        return None
-
-    def stream(self, model: str, request: Any, options: Any = None):
-        return self._stream_handle
-
-    async def generate(
-        self,
-        model: str,
-        request: Any,
-        provider: Optional[str] = None,
-        options: Any = None,
-    ) -> connect.AssistantMessage:
-        _ = model, request, provider, options
-        return await self._stream_handle.final_response()
+STREAM_DELTA_BATCH_SIZE = 64
 
 
 class RecordingAsyncLLMClient(FakeAsyncLLMClient):
@@ -228,15 +174,16 @@ def _assistant_response(
     )
 
 
-def _stream_with_text(text: str) -> FakeStreamHandle:
+def _stream_with_text(
+    text: str, batch_size: int = STREAM_DELTA_BATCH_SIZE
+) -> FakeStreamHandle:
     response = _assistant_response(text)
-    return FakeStreamHandle(
-        [
-            connect.TextDeltaEvent(index=0, delta=text),
-            connect.ResponseEndEvent(response=response),
-        ],
-        final_response=response,
-    )
+    events: List[connect.StreamEvent] = [
+        connect.TextDeltaEvent(index=0, delta=text[start : start + batch_size])
+        for start in range(0, max(len(text), 1), batch_size)
+    ]
+    events.append(connect.ResponseEndEvent(response=response))
+    return FakeStreamHandle(events, final_response=response)
 
 
 def _timeout_stream() -> FakeStreamHandle:
@@ -296,6 +243,22 @@ def _tool_call_response(tool_call_id: str) -> connect.AssistantMessage:
     return _assistant_response("Tool answer", tool_calls=[tool_call])
 
 
+def _outcome_tool_call(
+    tool_call_id: str, outcome: str = "success"
+) -> connect.ToolCallBlock:
+    return connect.ToolCallBlock(
+        id=tool_call_id,
+        name=llm_helpers.CHOOSE_OUTCOME_TOOL_NAME,
+        arguments={"outcome": outcome},
+    )
+
+
+def _last_output_step(steps: List[state.Step]) -> state.Step:
+    return next(
+        step for step in reversed(steps) if step.type == state.StepType.OUTPUT_MESSAGE
+    )
+
+
 def _build_execution_with_input(
     node_name: str, text: str
 ) -> tuple[state.WorkflowExecution, state.NodeExecution]:
@@ -315,6 +278,27 @@ def _build_execution_with_input(
     return run, execution
 
 
+class ConfigEchoTool:
+    async def openapi_spec(
+        self,
+        spec: vocode_settings.ToolSpec,
+    ) -> dict[str, Any]:
+        return {
+            "name": spec.name,
+            "parameters": {
+                "type": "object",
+                "properties": dict(spec.config),
+            },
+        }
+
+    async def run(
+        self,
+        spec: vocode_settings.ToolSpec,
+        args: Any,
+    ) -> None:
+        return None
+
+
 class FakeMCPService:
     def __init__(self) -> None:
         self.applied_workflow_requirements: List[tuple[str, List[str]]] = []
@@ -468,7 +452,9 @@ async def test_llm_executor_with_connect_mock_response(
         connect,
         "AsyncLLMClient",
         lambda *args, **kwargs: FakeAsyncLLMClient(
-            _stream_with_text("It's simple to use and easy to get started"),
+            _stream_with_text(
+                "It's simple to use and easy to get started", batch_size=8
+            ),
             **kwargs,
         ),
     )
@@ -486,16 +472,13 @@ async def test_llm_executor_with_connect_mock_response(
     run, execution = _build_execution_with_input("node-1", "Hey, I'm a mock request")
     inp = ExecutorInput(execution=execution, run=run)
 
-    steps: List[state.Step] = []
-    async for step in executor.run(inp):
-        steps.append(step)
+    steps = [step async for step in executor.run(inp)]
 
     assert steps
-    for step in steps:
-        assert step.execution is execution
+    assert all(step.execution is execution for step in steps)
 
     output_steps = [s for s in steps if s.type == state.StepType.OUTPUT_MESSAGE]
-    assert output_steps
+    assert len(output_steps) > 1
     final_message_step = output_steps[-1]
 
     assert final_message_step.message is not None
@@ -508,8 +491,7 @@ async def test_llm_executor_with_connect_mock_response(
     assert isinstance(final_message_step.llm_usage.prompt_tokens, int)
     assert isinstance(final_message_step.llm_usage.completion_tokens, int)
 
-    for s in output_steps[:-1]:
-        assert s.is_complete is False
+    assert all(s.is_complete is False for s in output_steps[:-1])
     assert final_message_step.is_complete is True
 
 
@@ -542,13 +524,9 @@ async def test_llm_executor_captures_debug_prompt_and_response_when_enabled(
     run, execution = _build_execution_with_input("node-debug-capture", "Hi")
     inp = ExecutorInput(execution=execution, run=run)
 
-    steps: List[state.Step] = []
-    async for step in executor.run(inp):
-        steps.append(step)
+    steps = [step async for step in executor.run(inp)]
 
-    final_message_step = [s for s in steps if s.type == state.StepType.OUTPUT_MESSAGE][
-        -1
-    ]
+    final_message_step = _last_output_step(steps)
     assert final_message_step.debug is not None
     request_debug = final_message_step.debug["request"]
     response_debug = final_message_step.debug["response"]
@@ -581,13 +559,9 @@ async def test_llm_executor_does_not_capture_debug_prompt_and_response_by_defaul
     run, execution = _build_execution_with_input("node-debug-default-off", "Hi")
     inp = ExecutorInput(execution=execution, run=run)
 
-    steps: List[state.Step] = []
-    async for step in executor.run(inp):
-        steps.append(step)
+    steps = [step async for step in executor.run(inp)]
 
-    final_message_step = [s for s in steps if s.type == state.StepType.OUTPUT_MESSAGE][
-        -1
-    ]
+    final_message_step = _last_output_step(steps)
     assert final_message_step.debug is None
 
 
@@ -833,13 +807,9 @@ async def test_llm_executor_outcome_tag_selection_strips_only_trailing_valid_tag
     )
     inp = ExecutorInput(execution=execution, run=run)
 
-    steps: List[state.Step] = []
-    async for step in executor.run(inp):
-        steps.append(step)
+    steps = [step async for step in executor.run(inp)]
 
-    final_message_step = [s for s in steps if s.type == state.StepType.OUTPUT_MESSAGE][
-        -1
-    ]
+    final_message_step = _last_output_step(steps)
     assert final_message_step.message is not None
     assert (
         final_message_step.message.text
@@ -893,9 +863,7 @@ async def test_llm_executor_counts_cached_tokens_toward_round_prompt_usage(
     run, execution = _build_execution_with_input("node-cached-usage", "Hi")
     inp = ExecutorInput(execution=execution, run=run)
 
-    steps: List[state.Step] = []
-    async for step in executor.run(inp):
-        steps.append(step)
+    steps = [step async for step in executor.run(inp)]
 
     output_steps = [s for s in steps if s.type == state.StepType.OUTPUT_MESSAGE]
     assert output_steps
@@ -1267,9 +1235,10 @@ async def test_llm_executor_persists_compaction_step_before_request(
     )
 
     with caplog.at_level(logging.INFO, logger="vocode"):
-        steps: List[state.Step] = []
-        async for step in executor.run(ExecutorInput(execution=execution, run=run)):
-            steps.append(step)
+        steps = [
+            step
+            async for step in executor.run(ExecutorInput(execution=execution, run=run))
+        ]
 
     assert any(step.type == state.StepType.CONTEXT_COMPACTION for step in steps)
 
@@ -1394,9 +1363,9 @@ async def test_llm_executor_emits_compaction_step_before_final_output(
         ),
     )
 
-    steps: List[state.Step] = []
-    async for step in executor.run(ExecutorInput(execution=execution, run=run)):
-        steps.append(step)
+    steps = [
+        step async for step in executor.run(ExecutorInput(execution=execution, run=run))
+    ]
 
     assert len(captured_requests) == 2
     assert steps[0].type == state.StepType.CONTEXT_COMPACTION
@@ -2423,9 +2392,7 @@ async def test_llm_executor_preview_usage_uses_last_tool_round_message_usage(
     assert first_step.llm_usage.cost_dollars == 0.5
     assert first_step.llm_usage.model_name == "gpt-3.5-turbo"
 
-    steps = [first_step]
-    async for step in agen:
-        steps.append(step)
+    steps = [first_step, *[step async for step in agen]]
 
     assert call_count["n"] == 1
     final_step = [step for step in steps if step.type == state.StepType.OUTPUT_MESSAGE][
@@ -2515,9 +2482,7 @@ async def test_llm_executor_uses_only_current_node_execution_messages_when_reset
 
     inp = ExecutorInput(execution=reset_execution, run=run)
 
-    steps: List[state.Step] = []
-    async for step in executor.run(inp):
-        steps.append(step)
+    steps = [step async for step in executor.run(inp)]
 
     assert steps
     assert len(captured_requests) == 1
@@ -2561,9 +2526,7 @@ async def test_llm_executor_timeouts_retry_and_fail(
     run, execution = _build_execution_with_input("node-timeouts", "Hi")
     inp = ExecutorInput(execution=execution, run=run)
 
-    steps: List[state.Step] = []
-    async for step in executor.run(inp):
-        steps.append(step)
+    steps = [step async for step in executor.run(inp)]
 
     assert call_count["n"] == 4
     assert sleep_delays == [1, 2, 4]
@@ -2613,9 +2576,7 @@ async def test_llm_executor_retry_clears_partial_streamed_text(
     run, execution = _build_execution_with_input("node-retry-partial-reset", "Hi")
     inp = ExecutorInput(execution=execution, run=run)
 
-    steps: List[state.Step] = []
-    async for step in executor.run(inp):
-        steps.append(step)
+    steps = [step async for step in executor.run(inp)]
 
     assert call_count["n"] == 2
     assert sleep_delays == [1]
@@ -2680,9 +2641,7 @@ async def test_llm_executor_rejects_when_max_rounds_reached(
     )
     inp = ExecutorInput(execution=execution, run=run)
 
-    steps: List[state.Step] = []
-    async for step in executor.run(inp):
-        steps.append(step)
+    steps = [step async for step in executor.run(inp)]
 
     assert len(steps) == 1
     assert steps[0].type == state.StepType.REJECTION
@@ -2725,9 +2684,7 @@ async def test_llm_executor_start_timeout_ignores_empty_chunks(
     run, execution = _build_execution_with_input("node-start-timeout-empty", "Hi")
     inp = ExecutorInput(execution=execution, run=run)
 
-    steps: List[state.Step] = []
-    async for step in executor.run(inp):
-        steps.append(step)
+    steps = [step async for step in executor.run(inp)]
 
     assert call_count["n"] == 4
     assert sleep_delays == [1, 2, 4]
@@ -2793,9 +2750,7 @@ async def test_llm_executor_populates_tool_spec_on_tool_call(
     run, execution = _build_execution_with_input("node-tools-call", "Hi")
     inp = ExecutorInput(execution=execution, run=run)
 
-    steps: List[state.Step] = []
-    async for step in executor.run(inp):
-        steps.append(step)
+    steps = [step async for step in executor.run(inp)]
 
     output_steps = [s for s in steps if s.type == state.StepType.OUTPUT_MESSAGE]
     assert output_steps
@@ -2822,27 +2777,7 @@ async def test_llm_executor_build_tools_uses_effective_specs_config_merge() -> N
     )
     project.settings.tools = [global_tool]
 
-    class EchoTool:
-        async def openapi_spec(
-            self,
-            spec: vocode_settings.ToolSpec,
-        ) -> dict[str, Any]:
-            return {
-                "name": spec.name,
-                "parameters": {
-                    "type": "object",
-                    "properties": dict(spec.config),
-                },
-            }
-
-        async def run(
-            self,
-            spec: vocode_settings.ToolSpec,
-            args: Any,
-        ) -> None:
-            return None
-
-    project.tools["echo"] = EchoTool()
+    project.tools["echo"] = ConfigEchoTool()
 
     node_tool = vocode_settings.ToolSpec(
         name="echo",
@@ -2902,27 +2837,7 @@ async def test_llm_executor_build_tools_respects_global_enabled_override() -> No
 
     executor = LLMExecutor(config=node, project=project)
 
-    class EchoTool:
-        async def openapi_spec(
-            self,
-            spec: vocode_settings.ToolSpec,
-        ) -> dict[str, Any]:
-            return {
-                "name": spec.name,
-                "parameters": {
-                    "type": "object",
-                    "properties": dict(spec.config),
-                },
-            }
-
-        async def run(
-            self,
-            spec: vocode_settings.ToolSpec,
-            args: Any,
-        ) -> None:
-            return None
-
-    project.tools["echo"] = EchoTool()
+    project.tools["echo"] = ConfigEchoTool()
     effective_specs = llm_helpers.build_effective_tool_specs(
         project,
         node,
@@ -3091,9 +3006,7 @@ async def test_llm_executor_outcome_tag_selection(
     run, execution = _build_execution_with_input("node-outcome-tag", "Hi")
     inp = ExecutorInput(execution=execution, run=run)
 
-    steps: List[state.Step] = []
-    async for step in executor.run(inp):
-        steps.append(step)
+    steps = [step async for step in executor.run(inp)]
 
     output_steps = [s for s in steps if s.type == state.StepType.OUTPUT_MESSAGE]
     assert output_steps
@@ -3104,8 +3017,7 @@ async def test_llm_executor_outcome_tag_selection(
 
     assert final_message_step.outcome_name == "success"
 
-    for s in output_steps[:-1]:
-        assert s.is_complete is False
+    assert all(s.is_complete is False for s in output_steps[:-1])
     assert final_message_step.is_complete is True
 
 
@@ -3114,11 +3026,7 @@ async def test_llm_executor_requires_final_message_after_outcome_tool_call(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     requests: List[Any] = []
-    first_tool_call = connect.ToolCallBlock(
-        id="call_outcome_1",
-        name=llm_helpers.CHOOSE_OUTCOME_TOOL_NAME,
-        arguments={"outcome": "success"},
-    )
+    first_tool_call = _outcome_tool_call("call_outcome_1")
     first_response = _assistant_response("", tool_calls=[first_tool_call])
     second_response = _assistant_response("Final answer after outcome")
     stream_handles = [
@@ -3164,9 +3072,7 @@ async def test_llm_executor_requires_final_message_after_outcome_tool_call(
     )
     inp = ExecutorInput(execution=execution, run=run)
 
-    steps: List[state.Step] = []
-    async for step in executor.run(inp):
-        steps.append(step)
+    steps = [step async for step in executor.run(inp)]
 
     assert len(requests) == 2
     second_request = requests[1]
@@ -3177,9 +3083,7 @@ async def test_llm_executor_requires_final_message_after_outcome_tool_call(
         for message in second_request.messages
     )
 
-    final_message_step = [s for s in steps if s.type == state.StepType.OUTPUT_MESSAGE][
-        -1
-    ]
+    final_message_step = _last_output_step(steps)
     assert final_message_step.message is not None
     assert final_message_step.message.text == "Final answer after outcome"
     assert final_message_step.outcome_name == "success"
@@ -3190,17 +3094,9 @@ async def test_llm_executor_retries_when_outcome_tool_call_is_invalid(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     requests: List[Any] = []
-    first_tool_call = connect.ToolCallBlock(
-        id="call_outcome_invalid",
-        name=llm_helpers.CHOOSE_OUTCOME_TOOL_NAME,
-        arguments={"outcome": "unknown"},
-    )
+    first_tool_call = _outcome_tool_call("call_outcome_invalid", "unknown")
     first_response = _assistant_response("Bad answer", tool_calls=[first_tool_call])
-    second_tool_call = connect.ToolCallBlock(
-        id="call_outcome_valid",
-        name=llm_helpers.CHOOSE_OUTCOME_TOOL_NAME,
-        arguments={"outcome": "success"},
-    )
+    second_tool_call = _outcome_tool_call("call_outcome_valid")
     second_response = _assistant_response(
         "Corrected final answer",
         tool_calls=[second_tool_call],
@@ -3250,9 +3146,7 @@ async def test_llm_executor_retries_when_outcome_tool_call_is_invalid(
     )
     inp = ExecutorInput(execution=execution, run=run)
 
-    steps: List[state.Step] = []
-    async for step in executor.run(inp):
-        steps.append(step)
+    steps = [step async for step in executor.run(inp)]
 
     assert len(requests) == 2
     second_request = requests[1]
@@ -3269,9 +3163,7 @@ async def test_llm_executor_retries_when_outcome_tool_call_is_invalid(
         for message in second_request.messages
     )
 
-    final_message_step = [s for s in steps if s.type == state.StepType.OUTPUT_MESSAGE][
-        -1
-    ]
+    final_message_step = _last_output_step(steps)
     assert final_message_step.message is not None
     assert final_message_step.message.text == "Corrected final answer"
     assert final_message_step.outcome_name == "success"
@@ -3329,9 +3221,7 @@ async def test_llm_executor_retries_when_tag_outcome_is_missing(
     run, execution = _build_execution_with_input("node-outcome-tag-retry", "Hi")
     inp = ExecutorInput(execution=execution, run=run)
 
-    steps: List[state.Step] = []
-    async for step in executor.run(inp):
-        steps.append(step)
+    steps = [step async for step in executor.run(inp)]
 
     assert len(requests) == 2
     assert any(
@@ -3340,9 +3230,7 @@ async def test_llm_executor_retries_when_tag_outcome_is_missing(
         for message in requests[1].messages
     )
 
-    final_message_step = [s for s in steps if s.type == state.StepType.OUTPUT_MESSAGE][
-        -1
-    ]
+    final_message_step = _last_output_step(steps)
     assert final_message_step.message is not None
     assert final_message_step.message.text == "Tagged answer again"
     assert final_message_step.outcome_name == "success"
@@ -3357,11 +3245,7 @@ async def test_llm_executor_persists_cached_outcome_across_tool_rounds(
         name="echo",
         arguments={"x": 1},
     )
-    outcome_call = connect.ToolCallBlock(
-        id="call_outcome_1",
-        name=llm_helpers.CHOOSE_OUTCOME_TOOL_NAME,
-        arguments={"outcome": "success"},
-    )
+    outcome_call = _outcome_tool_call("call_outcome_1")
     first_response = _assistant_response(
         "Using a tool first",
         tool_calls=[tool_call, outcome_call],
@@ -3408,13 +3292,9 @@ async def test_llm_executor_persists_cached_outcome_across_tool_rounds(
     run, execution = _build_execution_with_input("node-outcome-tool-round", "Hi")
     inp = ExecutorInput(execution=execution, run=run)
 
-    first_steps: List[state.Step] = []
-    async for step in executor.run(inp):
-        first_steps.append(step)
+    first_steps = [step async for step in executor.run(inp)]
 
-    first_final = [s for s in first_steps if s.type == state.StepType.OUTPUT_MESSAGE][
-        -1
-    ]
+    first_final = _last_output_step(first_steps)
     assert first_final.message is not None
     assert len(first_final.message.tool_call_requests) == 1
     assert first_final.message.tool_call_requests[0].name == "echo"
@@ -3441,13 +3321,9 @@ async def test_llm_executor_persists_cached_outcome_across_tool_rounds(
         ),
     )
 
-    second_steps: List[state.Step] = []
-    async for step in executor.run(inp):
-        second_steps.append(step)
+    second_steps = [step async for step in executor.run(inp)]
 
-    second_final = [s for s in second_steps if s.type == state.StepType.OUTPUT_MESSAGE][
-        -1
-    ]
+    second_final = _last_output_step(second_steps)
     assert second_final.message is not None
     assert second_final.message.text == "Final answer after tool"
     assert second_final.outcome_name == "success"
@@ -3572,25 +3448,24 @@ async def test_llm_executor_uses_custom_missing_outcome_retry_instruction(
 async def test_llm_executor_outcome_function_selection(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    RECORDED_TOOL_CALLS.clear()
-    tool_call = connect.ToolCallBlock(
-        id="call_1",
-        name=llm_helpers.CHOOSE_OUTCOME_TOOL_NAME,
-        arguments={"outcome": "success"},
-    )
-    RECORDED_TOOL_CALLS.append(tool_call.name)
+    tool_call = _outcome_tool_call("call_1")
     response = _assistant_response("Functional answer", tool_calls=[tool_call])
+    requests: List[Any] = []
+    stream_handles = [
+        FakeStreamHandle(
+            [
+                connect.TextDeltaEvent(index=0, delta="Functional answer"),
+                connect.ResponseEndEvent(response=response),
+            ],
+            final_response=response,
+        )
+    ]
     monkeypatch.setattr(
         connect,
         "AsyncLLMClient",
-        lambda *args, **kwargs: FakeAsyncLLMClient(
-            FakeStreamHandle(
-                [
-                    connect.TextDeltaEvent(index=0, delta="Functional answer"),
-                    connect.ResponseEndEvent(response=response),
-                ],
-                final_response=response,
-            ),
+        lambda *args, **kwargs: RecordingAsyncLLMClient(
+            stream_handles,
+            requests,
             **kwargs,
         ),
     )
@@ -3612,11 +3487,12 @@ async def test_llm_executor_outcome_function_selection(
     run, execution = _build_execution_with_input("node-outcome-function", "Hi")
     inp = ExecutorInput(execution=execution, run=run)
 
-    steps: List[state.Step] = []
-    async for step in executor.run(inp):
-        steps.append(step)
+    steps = [step async for step in executor.run(inp)]
 
-    assert RECORDED_TOOL_CALLS == [llm_helpers.CHOOSE_OUTCOME_TOOL_NAME]
+    assert len(requests) == 1
+    assert [tool.name for tool in requests[0].tools] == [
+        llm_helpers.CHOOSE_OUTCOME_TOOL_NAME
+    ]
 
     output_steps = [s for s in steps if s.type == state.StepType.OUTPUT_MESSAGE]
     assert output_steps
@@ -3635,8 +3511,7 @@ async def test_llm_executor_outcome_function_selection(
 
     assert final_message_step.outcome_name == "success"
 
-    for s in output_steps[:-1]:
-        assert s.is_complete is False
+    assert all(s.is_complete is False for s in output_steps[:-1])
     assert final_message_step.is_complete is True
 
 
@@ -3657,9 +3532,7 @@ async def test_llm_executor_rejects_chatgpt_without_authorization() -> None:
     run, execution = _build_execution_with_input("node-chatgpt-auth", "Hi")
     inp = ExecutorInput(execution=execution, run=run)
 
-    steps: List[state.Step] = []
-    async for step in executor.run(inp):
-        steps.append(step)
+    steps = [step async for step in executor.run(inp)]
 
     assert len(steps) == 1
     assert steps[0].type == state.StepType.REJECTION
@@ -3700,9 +3573,7 @@ async def test_llm_executor_surfaces_structured_connect_error_metadata(
     run, execution = _build_execution_with_input("node-connect-error", "Hi")
     inp = ExecutorInput(execution=execution, run=run)
 
-    steps: List[state.Step] = []
-    async for step in executor.run(inp):
-        steps.append(step)
+    steps = [step async for step in executor.run(inp)]
 
     assert len(steps) == 2
     assert steps[0].type == state.StepType.OUTPUT_MESSAGE
@@ -3755,9 +3626,7 @@ async def test_llm_executor_retries_configured_hard_errors(
     run, execution = _build_execution_with_input("node-hard-error-retries", "Hi")
     inp = ExecutorInput(execution=execution, run=run)
 
-    steps: List[state.Step] = []
-    async for step in executor.run(inp):
-        steps.append(step)
+    steps = [step async for step in executor.run(inp)]
 
     assert call_count["n"] == 3
     final_step = steps[-1]
@@ -3808,9 +3677,7 @@ async def test_llm_executor_respects_configured_max_retries(
     run, execution = _build_execution_with_input("node-max-retries-setting", "Hi")
     inp = ExecutorInput(execution=execution, run=run)
 
-    steps: List[state.Step] = []
-    async for step in executor.run(inp):
-        steps.append(step)
+    steps = [step async for step in executor.run(inp)]
 
     assert call_count["n"] == 2
     final_step = steps[-1]
@@ -3882,9 +3749,7 @@ async def test_llm_executor_hard_error_retry_streak_resets_after_success(
     run, execution = _build_execution_with_input("node-hard-error-reset", "Hi")
     inp = ExecutorInput(execution=execution, run=run)
 
-    steps: List[state.Step] = []
-    async for step in executor.run(inp):
-        steps.append(step)
+    steps = [step async for step in executor.run(inp)]
 
     assert len(requests) == 4
     final_step = steps[-1]
@@ -3985,9 +3850,9 @@ async def test_llm_executor_retries_once_after_context_length_error(
         ),
     )
 
-    steps: List[state.Step] = []
-    async for step in executor.run(ExecutorInput(execution=execution, run=run)):
-        steps.append(step)
+    steps = [
+        step async for step in executor.run(ExecutorInput(execution=execution, run=run))
+    ]
 
     assert len(requests) == 4
     assert any(
@@ -4288,9 +4153,10 @@ async def test_llm_executor_rejects_on_permanent_compaction_summary_error(
     )
 
     with caplog.at_level(logging.INFO, logger="vocode"):
-        steps: List[state.Step] = []
-        async for step in executor.run(ExecutorInput(execution=execution, run=run)):
-            steps.append(step)
+        steps = [
+            step
+            async for step in executor.run(ExecutorInput(execution=execution, run=run))
+        ]
 
     assert len(steps) == 1
     assert steps[0].type == state.StepType.REJECTION
@@ -14,48 +14,10 @@ from vocode.runner.executors.llm.llm import (
     ToolCallProviderState,
 )
 from vocode.runner.executors.llm.models import LLMNode
+from tests.executors.llm_stubs import FakeAsyncLLMClient, FakeStreamHandle
 from tests.stub_project import StubProject
 
 
-class _FakeStreamHandle:
-    def __init__(
-        self,
-        events: list[connect.StreamEvent],
-        final_response: connect.AssistantMessage,
-    ) -> None:
-        self._events = events
-        self._final_response = final_response
-        self._index = 0
-
-    def __aiter__(self):
-        self._index = 0
-        return self
-
-    async def __anext__(self):
-        if self._index >= len(self._events):
-            raise StopAsyncIteration
-        event = self._events[self._index]
-        self._index += 1
-        return event
-
-    async def final_response(self) -> connect.AssistantMessage:
-        return self._final_response
-
-
-class _FakeAsyncLLMClient:
-    def __init__(self, stream_handle: _FakeStreamHandle, **kwargs) -> None:
-        self._stream_handle = stream_handle
-
-    async def __aenter__(self):
-        return self
-
-    async def __aexit__(self, exc_type, exc, tb) -> None:
-        return None
-
-    def stream(self, model: str, request: object, options: object = None):
-        return self._stream_handle
-
-
 def test_build_connect_messages_with_tool_call_and_tool_result() -> None:
     history = HistoryManager()
     cfg = LLMNode(
@@ -603,8 +565,8 @@ async def test_run_streaming_reuses_same_message_id_across_intermediate_updates(
     monkeypatch.setattr(
         connect,
         "AsyncLLMClient",
-        lambda *args, **kwargs: _FakeAsyncLLMClient(
-            _FakeStreamHandle(
+        lambda *args, **kwargs: FakeAsyncLLMClient(
+            FakeStreamHandle(
                 [
                     connect.TextDeltaEvent(index=0, delta="Why"),
                     connect.TextDeltaEvent(index=0, delta=" do"),
@@ -616,9 +578,7 @@ async def test_run_streaming_reuses_same_message_id_across_intermediate_updates(
         ),
     )
 
-    steps = []
-    async for step in executor.run(inp):
-        steps.append(step)
+    steps = [step async for step in executor.run(inp)]
 
     assert len(steps) == 4
     assert steps[0].message_id is None
@@ -9,7 +9,11 @@ from vocode import settings as vocode_settings
 from vocode.manager import (
     autocomplete_providers as _autocomplete_providers,
 )  # noqa: F401
-from vocode.manager.autocomplete import AutocompleteManager, AutocompleteItem
+from vocode.manager.autocomplete import (
+    AutocompleteManager,
+    AutocompleteItem,
+    PrefixIndex,
+)
 from vocode.manager.file_path_cache import FilePathCacheService
 from vocode.manager.server import UIServer
 from vocode.manager import helpers as manager_helpers
@@ -185,3 +189,17 @@ async def test_file_autocomplete_provider_uses_cached_file_path_service(
         await server.stop()
 
     assert [item.insert_text for item in items] == ["alpha.txt"]
+
+
+def test_prefix_index_returns_lowest_matching_indexes() -> None:
+    index = PrefixIndex(
+        ["alpha.txt", "alpine/", "alpine/a.py", "beta.py", "alpha2.txt"]
+    )
+
+    assert index.search("alp", 2) == [0, 1]
+    assert index.search("alp", 5) == [0, 1, 2, 4]
+    assert index.search("alph", 5) == [0, 4]
+    assert index.search("alpine/", 1) == [1]
+    assert index.search("b", 5) == [3]
+    assert index.search("gamma", 5) == []
+    assert index.search("", 2) == [0, 1]
@@ -218,6 +218,26 @@ async def test_command_manager_parse_args_with_quotes() -> None:
     assert received == [["one", "two words", "three"]]
 
 
+@pytest.mark.asyncio
+async def test_command_manager_repeated_command_gets_fresh_args() -> None:
+    manager = CommandManager()
+    server_endpoint, _ = manager_helpers.InMemoryEndpoint.pair()
+    server = UIServer(project=StubProject(), endpoint=server_endpoint)
+
+    received: list[list[str]] = []
+
+    async def handler(srv: UIServer, args: list[str]) -> None:
+        args.append("mutated")
+        received.append(args)
+
+    await manager.register("echo", handler)
+
+    await manager.execute(server, "echo one two")
+    await manager.execute(server, "echo one two")
+
+    assert received == [["one", "two", "mutated"], ["one", "two", "mutated"]]
+
+
 @pytest.mark.asyncio
 async def test_command_manager_execute_reports_syntax_error() -> None:
     manager = CommandManager()
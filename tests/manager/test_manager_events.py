@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
 from typing import AsyncIterator, Dict, Optional
 
 import pytest
@@ -10,7 +11,6 @@ from vocode.history.manager import HistoryManager
 from vocode.history.models import HistoryMutationResult
 from vocode.input_manager import InputManager
 from vocode.manager.base import BaseManager, RunnerFrame
-from vocode.persistence import state_manager as persistence_state_manager
 from vocode.runner.base import BaseExecutor, ExecutorFactory, ExecutorInput
 from vocode.runner.executors.llm.compaction import CompactionSummaryState
 from vocode.runner.proto import (
@@ -23,6 +23,10 @@ from vocode.runner.runner import Runner
 from tests.stub_project import StubProject
 
 
+_NOOP_RESP = RunEventResp(resp_type=RunEventResponseType.NOOP, message=None)
+_APPROVE_RESP = RunEventResp(resp_type=RunEventResponseType.APPROVE, message=None)
+
+
 @ExecutorFactory.register("manager-test")
 class ManagerTestExecutor(BaseExecutor):
     type = "manager-test"
@@ -131,7 +135,9 @@ class ManagerCompactionExecutor(BaseExecutor):
         yield step
 
 
-block_event: asyncio.Event | None = None
+_BLOCK_EVENT: contextvars.ContextVar[asyncio.Event] = contextvars.ContextVar(
+    "block_event"
+)
 
 
 @ExecutorFactory.register("manager-blocking")
@@ -142,8 +148,7 @@ class ManagerBlockingExecutor(BaseExecutor):
         super().__init__(config, project)
 
     async def run(self, inp: ExecutorInput) -> AsyncIterator[state.Step]:
-        assert block_event is not None
-        await block_event.wait()
+        await _BLOCK_EVENT.get().wait()
         history = self.project.history
         msg = state.Message(
             role=models.Role.ASSISTANT,
@@ -163,6 +168,8 @@ class ManagerBlockingExecutor(BaseExecutor):
 
 
 class DummyWorkflow:
+    __slots__ = ("name", "graph", "need_input", "need_input_prompt")
+
     def __init__(
         self,
         name: str,
@@ -180,7 +187,6 @@ class FakeProject(StubProject):
     def __init__(self) -> None:
         super().__init__()
         self.settings = None
-        self.state_manager = persistence_state_manager.NullWorkflowStateManager()
 
 
 @pytest.mark.asyncio
@@ -203,13 +209,13 @@ async def test_manager_run_event_subscriber_emits_and_handles_responses() -> Non
     async def run_event_listener(frame: RunnerFrame, event) -> RunEventResp | None:
         assert frame.runner is runner
         if event.kind == RunEventReqKind.STATUS:
-            return RunEventResp(resp_type=RunEventResponseType.NOOP, message=None)
+            return _NOOP_RESP
         assert event.step is not None
         step = event.step
         events.append(step)
         if step.type in (state.StepType.PROMPT, state.StepType.PROMPT_CONFIRM):
-            return RunEventResp(resp_type=RunEventResponseType.APPROVE, message=None)
-        return RunEventResp(resp_type=RunEventResponseType.NOOP, message=None)
+            return _APPROVE_RESP
+        return _NOOP_RESP
 
     manager = BaseManager(project=project, run_event_listener=run_event_listener)  # type: ignore[arg-type]
     frame = RunnerFrame(
@@ -227,14 +233,12 @@ async def test_manager_run_event_subscriber_emits_and_handles_responses() -> Non
     assert manager.runner_stack == []
 
     node_exec = next(iter(runner.execution.node_executions.values()))
-    output_steps = [s for s in events if s.type == state.StepType.OUTPUT_MESSAGE]
-    prompt_steps = [s for s in events if s.type == state.StepType.PROMPT_CONFIRM]
-    assert output_steps
-    assert prompt_steps
-    assert [
-        s for s in node_exec.iter_steps() if s.type == state.StepType.PROMPT_CONFIRM
-    ]
-    assert [s for s in node_exec.iter_steps() if s.type == state.StepType.APPROVAL]
+    event_types = {s.type for s in events}
+    assert state.StepType.OUTPUT_MESSAGE in event_types
+    assert state.StepType.PROMPT_CONFIRM in event_types
+    node_step_types = {s.type for s in node_exec.iter_steps()}
+    assert state.StepType.PROMPT_CONFIRM in node_step_types
+    assert state.StepType.APPROVAL in node_step_types
 
 
 @pytest.mark.asyncio
@@ -260,11 +264,11 @@ async def test_manager_status_events_are_stored_and_not_forwarded() -> None:
 
     async def run_event_listener(frame: RunnerFrame, event) -> RunEventResp | None:
         if event.kind == RunEventReqKind.STATUS:
-            return RunEventResp(resp_type=RunEventResponseType.NOOP, message=None)
+            return _NOOP_RESP
         assert event.kind == RunEventReqKind.STEP
         assert event.step is not None
         steps.append(event.step)
-        return RunEventResp(resp_type=RunEventResponseType.NOOP, message=None)
+        return _NOOP_RESP
 
     manager = BaseManager(project=project, run_event_listener=run_event_listener)  # type: ignore[arg-type]
     frame = RunnerFrame(
@@ -309,10 +313,10 @@ async def test_manager_forwards_context_compaction_steps_as_normal_step_events()
 
     async def run_event_listener(frame: RunnerFrame, event) -> RunEventResp | None:
         if event.kind == RunEventReqKind.STATUS:
-            return RunEventResp(resp_type=RunEventResponseType.NOOP, message=None)
+            return _NOOP_RESP
         assert event.step is not None
         seen_steps.append(event.step)
-        return RunEventResp(resp_type=RunEventResponseType.NOOP, message=None)
+        return _NOOP_RESP
 
     manager = BaseManager(project=project, run_event_listener=run_event_listener)  # type: ignore[arg-type]
     frame = RunnerFrame(
@@ -347,46 +351,48 @@ async def test_manager_emits_final_status_on_runner_stop() -> None:
     project = FakeProject()
     initial_message = state.Message(role=models.Role.USER, text="hello")
 
-    global block_event
     block_event = asyncio.Event()
+    token = _BLOCK_EVENT.set(block_event)
+    try:
+        runner = Runner(
+            workflow=workflow,
+            project=project,  # type: ignore[arg-type]
+            initial_message=initial_message,
+        )
 
-    runner = Runner(
-        workflow=workflow,
-        project=project,  # type: ignore[arg-type]
-        initial_message=initial_message,
-    )
+        status_events: list[state.RunnerStatus] = []
+        first_status = asyncio.Event()
 
-    status_events: list[state.RunnerStatus] = []
+        async def run_event_listener(frame: RunnerFrame, event) -> RunEventResp | None:
+            if event.kind == RunEventReqKind.STATUS:
+                assert event.stats is not None
+                status_events.append(event.stats.status)
+                first_status.set()
+            return _NOOP_RESP
 
-    async def run_event_listener(frame: RunnerFrame, event) -> RunEventResp | None:
-        if event.kind == RunEventReqKind.STATUS:
-            assert event.stats is not None
-            status_events.append(event.stats.status)
-        return RunEventResp(resp_type=RunEventResponseType.NOOP, message=None)
+        manager = BaseManager(project=project, run_event_listener=run_event_listener)  # type: ignore[arg-type]
+        frame = RunnerFrame(
+            workflow_name="wf-manager-stop-status",
+            runner=runner,
+            initial_message=initial_message,
+            agen=runner.run(),
+        )
+        manager._runner_stack.append(frame)
 
-    manager = BaseManager(project=project, run_event_listener=run_event_listener)  # type: ignore[arg-type]
-    frame = RunnerFrame(
-        workflow_name="wf-manager-stop-status",
-        runner=runner,
-        initial_message=initial_message,
-        agen=runner.run(),
-    )
-    manager._runner_stack.append(frame)
+        manager._driver_task = asyncio.create_task(manager._run_runner_task())
 
-    manager._driver_task = asyncio.create_task(manager._run_runner_task())
+        await first_status.wait()
 
-    while not status_events:
+        await manager.stop_current_runner()
         await asyncio.sleep(0)
 
-    await manager.stop_current_runner()
-    await asyncio.sleep(0)
-
-    assert block_event is not None
-    block_event.set()
+        block_event.set()
 
-    assert runner.status == state.RunnerStatus.STOPPED
-    assert state.RunnerStatus.RUNNING in status_events
-    assert state.RunnerStatus.STOPPED in status_events
+        assert runner.status == state.RunnerStatus.STOPPED
+        assert state.RunnerStatus.RUNNING in status_events
+        assert state.RunnerStatus.STOPPED in status_events
+    finally:
+        _BLOCK_EVENT.reset(token)
 
 
 @pytest.mark.asyncio
@@ -408,7 +414,7 @@ async def test_manager_keeps_stopped_runner_on_stack_and_continue_resumes() -> N
     )
 
     async def run_event_listener(frame: RunnerFrame, event) -> RunEventResp | None:
-        return RunEventResp(resp_type=RunEventResponseType.NOOP, message=None)
+        return _NOOP_RESP
 
     manager = BaseManager(project=project, run_event_listener=run_event_listener)  # type: ignore[arg-type]
     frame = RunnerFrame(
@@ -502,7 +508,7 @@ async def test_manager_edit_history_replaces_last_user_input_and_resumes() -> No
     runner.status = state.RunnerStatus.STOPPED
 
     async def run_event_listener(frame: RunnerFrame, event) -> RunEventResp | None:
-        return RunEventResp(resp_type=RunEventResponseType.NOOP, message=None)
+        return _NOOP_RESP
 
     manager = BaseManager(project=project, run_event_listener=run_event_listener)  # type: ignore[arg-type]
     frame = RunnerFrame(
@@ -610,7 +616,7 @@ async def test_manager_edit_history_replaces_tool_rejection_message() -> None:
     runner.status = state.RunnerStatus.STOPPED
 
     async def run_event_listener(frame: RunnerFrame, event) -> RunEventResp | None:
-        return RunEventResp(resp_type=RunEventResponseType.NOOP, message=None)
+        return _NOOP_RESP
 
     manager = BaseManager(project=project, run_event_listener=run_event_listener)  # type: ignore[arg-type]
     manager._runner_stack.append(
@@ -710,7 +716,7 @@ async def test_manager_edit_history_stops_parent_runner_when_going_up_stack(
     child_runner.status = state.RunnerStatus.STOPPED
 
     async def run_event_listener(frame: RunnerFrame, event) -> RunEventResp | None:
-        return RunEventResp(resp_type=RunEventResponseType.NOOP, message=None)
+        return _NOOP_RESP
 
     manager = BaseManager(project=project, run_event_listener=run_event_listener)  # type: ignore[arg-type]
 
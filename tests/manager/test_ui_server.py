@@ -84,10 +84,6 @@ async def test_uiserver_on_runner_event_roundtrip() -> None:
         step=step,
     )
 
-    async def dummy_coro() -> None:
-        await asyncio.Event().wait()
-
-    dummy_task = asyncio.create_task(dummy_coro())
     runner = DummyRunnerWithWorkflow(["node1"])
     frame = RunnerFrame(
         workflow_name="wf-ui-server",
@@ -115,10 +111,6 @@ async def test_uiserver_on_runner_event_roundtrip() -> None:
     assert resp.resp_type == runner_proto.RunEventResponseType.NOOP
     assert resp.message is None
 
-    dummy_task.cancel()
-    with pytest.raises(asyncio.CancelledError):
-        await dummy_task
-
 
 @pytest.mark.asyncio
 async def test_uiserver_on_runner_event_forwards_compaction_step() -> None:
@@ -209,10 +201,6 @@ async def test_uiserver_active_node_started_at_uses_first_step_time() -> None:
         def __init__(self, execution: state.WorkflowExecution) -> None:
             self.execution = execution
 
-    async def dummy_coro() -> None:
-        await asyncio.Event().wait()
-
-    dummy_task = asyncio.create_task(dummy_coro())
     runner = DummyRunner(execution)
     frame = RunnerFrame(
         workflow_name=execution.workflow_name,
@@ -257,10 +245,6 @@ async def test_uiserver_active_node_started_at_uses_first_step_time() -> None:
     assert payload2.active_node_started_at == step.created_at
     assert payload2.last_user_input_at == execution.last_user_input_at
 
-    dummy_task.cancel()
-    with pytest.raises(asyncio.CancelledError):
-        await dummy_task
-
 
 @pytest.mark.asyncio
 async def test_uiserver_clears_input_waiters_on_runner_stop() -> None:
@@ -288,10 +272,6 @@ async def test_uiserver_clears_input_waiters_on_runner_stop() -> None:
         def __init__(self, execution: state.WorkflowExecution) -> None:
             self.execution = execution
 
-    async def dummy_coro() -> None:
-        await asyncio.Event().wait()
-
-    dummy_task = asyncio.create_task(dummy_coro())
     runner = DummyRunner(execution)
     frame = RunnerFrame(
         workflow_name=execution.workflow_name,
@@ -320,10 +300,6 @@ async def test_uiserver_clears_input_waiters_on_runner_stop() -> None:
     envelope_state = await client_endpoint.recv()
     assert envelope_state.payload.kind == manager_proto.BasePacketKind.UI_STATE
 
-    dummy_task.cancel()
-    with pytest.raises(asyncio.CancelledError):
-        await dummy_task
-
 
 @pytest.mark.asyncio
 async def test_uiserver_handles_autocomplete_request() -> None:
@@ -333,10 +309,7 @@ async def test_uiserver_handles_autocomplete_request() -> None:
 
     req = manager_proto.AutocompleteReqPacket(text="he", row=0, col=2)
     envelope = manager_proto.BasePacketEnvelope(msg_id=1, payload=req)
-    await client_endpoint.send(envelope)
-
-    server_incoming = await server_endpoint.recv()
-    handled = await server.on_ui_packet(server_incoming)
+    handled = await server.on_ui_packet(envelope)
     assert handled is True
 
     resp_envelope = await client_endpoint.recv()
@@ -444,10 +417,6 @@ async def test_uiserver_on_runner_event_user_input_message() -> None:
         step=step,
     )
 
-    async def dummy_coro() -> None:
-        await asyncio.Event().wait()
-
-    dummy_task = asyncio.create_task(dummy_coro())
     runner = DummyRunnerWithWorkflow(["node1"], execution=execution)
     frame = RunnerFrame(
         workflow_name="wf-ui-server-user-input",
@@ -504,10 +473,6 @@ async def test_uiserver_on_runner_event_user_input_message() -> None:
     assert prompt_payload.title is None
     assert prompt_payload.subtitle is None
 
-    dummy_task.cancel()
-    with pytest.raises(asyncio.CancelledError):
-        await dummy_task
-
 
 @pytest.mark.asyncio
 async def test_uiserver_on_runner_event_user_input_prompt_confirm_title() -> None:
@@ -537,10 +502,6 @@ async def test_uiserver_on_runner_event_user_input_prompt_confirm_title() -> Non
         step=step,
     )
 
-    async def dummy_coro() -> None:
-        await asyncio.Event().wait()
-
-    dummy_task = asyncio.create_task(dummy_coro())
     runner = DummyRunnerWithWorkflow(["node1"], execution=execution)
     frame = RunnerFrame(
         workflow_name="wf-ui-server-user-input-confirm",
@@ -582,10 +543,6 @@ async def test_uiserver_on_runner_event_user_input_prompt_confirm_title() -> Non
     assert resp is not None
     assert resp.resp_type == runner_proto.RunEventResponseType.NOOP
 
-    dummy_task.cancel()
-    with pytest.raises(asyncio.CancelledError):
-        await dummy_task
-
 
 @pytest.mark.asyncio
 async def test_uiserver_autostarts_default_workflow(
@@ -738,10 +695,6 @@ async def test_uiserver_status_event_emits_ui_state_packet() -> None:
         def __init__(self, execution: state.WorkflowExecution) -> None:
             self.execution = execution
 
-    async def dummy_coro() -> None:
-        await asyncio.Event().wait()
-
-    dummy_task = asyncio.create_task(dummy_coro())
     runner = DummyRunner(execution)
     frame = RunnerFrame(
         workflow_name=execution.workflow_name,
@@ -855,7 +808,7 @@ async def test_uiserver_handles_stop_request_packet(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     project = StubProject()
-    server_endpoint, client_endpoint = InMemoryEndpoint.pair()
+    server_endpoint, _ = InMemoryEndpoint.pair()
     server = UIServer(project=project, endpoint=server_endpoint)
 
     called: list[object] = []
@@ -867,10 +820,7 @@ async def test_uiserver_handles_stop_request_packet(
 
     stop_packet = manager_proto.StopReqPacket()
     envelope = manager_proto.BasePacketEnvelope(msg_id=1, payload=stop_packet)
-    await client_endpoint.send(envelope)
-
-    server_envelope = await server_endpoint.recv()
-    handled = await server.on_ui_packet(server_envelope)
+    handled = await server.on_ui_packet(envelope)
 
     assert handled is True
     assert called
@@ -1257,7 +1207,6 @@ async def test_uiserver_aa_command_autoapproves_and_confirms_tool_call() -> None
         step=step,
     )
 
-    dummy_task = asyncio.create_task(asyncio.Event().wait())
     runner = DummyRunnerWithWorkflow(["node1"], execution=execution)
     frame = RunnerFrame(
         workflow_name="wf-ui-aa",
@@ -1308,10 +1257,6 @@ async def test_uiserver_aa_command_autoapproves_and_confirms_tool_call() -> None
     text_envelope = await client_endpoint.recv()
     assert isinstance(text_envelope.payload, manager_proto.TextMessagePacket)
 
-    dummy_task.cancel()
-    with pytest.raises(asyncio.CancelledError):
-        await dummy_task
-
 
 @pytest.mark.asyncio
 async def test_uiserver_user_input_sends_error_when_no_active_input_request() -> None:
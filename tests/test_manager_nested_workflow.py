@@ -184,9 +184,9 @@ async def test_nested_workflow_execution_via_manager():
     assert child_runner.last_final_message is not None
     assert child_runner.last_final_message.text == "child-final:parent-input"
     assert parent_runner.status == state.RunnerStatus.FINISHED
-    node_execs_by_name: dict[str, state.NodeExecution] = {}
-    for ne in parent_runner.execution.node_executions.values():
-        node_execs_by_name[ne.node] = ne
+    node_execs_by_name = {
+        ne.node: ne for ne in parent_runner.execution.node_executions.values()
+    }
     assert "parent-node" in node_execs_by_name
     parent_exec = node_execs_by_name["parent-node"]
     tool_response_steps = [
@@ -266,9 +266,9 @@ async def test_nested_workflow_failure_is_returned_as_tool_error():
     await asyncio.wait_for(manager._driver_task, timeout=5.0)
     await manager.stop()
 
-    node_execs_by_name: dict[str, state.NodeExecution] = {}
-    for ne in parent_runner.execution.node_executions.values():
-        node_execs_by_name[ne.node] = ne
+    node_execs_by_name = {
+        ne.node: ne for ne in parent_runner.execution.node_executions.values()
+    }
     parent_exec = node_execs_by_name["parent-node"]
     tool_response_steps = [
         s
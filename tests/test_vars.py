@@ -0,0 +1,153 @@
+import pydantic
+import pytest
+
+from vocode import vars as vars_mod
+
+
+def test_interpolate_resolves_placeholders() -> None:
+    env = vars_mod.VarEnv({"A": "one", "B": 2})
+
+    assert env.interpolate("${A}-${B}-${A}") == "one-2-one"
+    assert env.interpolate("prefix ${A} suffix") == "prefix one suffix"
+
+
+def test_interpolate_returns_plain_template_unchanged() -> None:
+    env = vars_mod.VarEnv({"A": "one"})
+    template = "no variables here"
+
+    assert env.interpolate(template) is template
+
+
+def test_interpolate_keeps_unknown_and_unescapes_escaped() -> None:
+    env = vars_mod.VarEnv({"A": "one"})
+
+    assert env.interpolate("${MISSING}") == "${MISSING}"
+    assert env.interpolate("$${A} ${A}") == "${A} one"
+
+
+def test_var_interpolated_and_binding_share_tokenization() -> None:
+    env = vars_mod.VarEnv({"A": "one", "B": "two"})
+    expr = vars_mod.VarInterpolated(env, "${A}/${B}/${A}")
+
+    assert expr.resolve() == "one/two/one"
+
+    owner = {"key": ""}
+    binding = vars_mod.VarInterpolatedBinding(
+        vars_mod.VarBindTargetDictKey(owner, "key"), "${A}/${B}/${A}"
+    )
+    assert binding.dependencies() == ["A", "B"]
+    binding.apply(env)
+    assert owner["key"] == "one/two/one"
+
+
+def test_interpolate_does_not_unescape_substituted_values() -> None:
+    env = vars_mod.VarEnv({"A": "$${raw}"})
+
+    assert env.interpolate("$$${A} ${A}") == "$${A} $${raw}"
+    assert vars_mod.VarInterpolated(env, "x ${A}").resolve() == "x $${raw}"
+
+
+def test_var_interpolated_constant_and_single_placeholder_templates() -> None:
+    env = vars_mod.VarEnv({"A": "one"})
+
+    assert vars_mod.VarInterpolated(env, "$${A} literal").resolve() == "${A} literal"
+    assert vars_mod.VarInterpolated(env, "${A}").resolve() == "one"
+    assert vars_mod.VarInterpolated(env, "${MISSING}").resolve() == "${MISSING}"
+
+
+class _InnerVarModel(vars_mod.BaseVarModel):
+    host: str = ""
+    port: int = 0
+
+
+class _OuterVarModel(vars_mod.BaseVarModel):
+    name: str
+    inner: _InnerVarModel
+
+
+def test_base_var_model_resolves_and_assigns_var_backed_fields() -> None:
+    model = _OuterVarModel(
+        name="${NAME}",
+        inner=_InnerVarModel(host="h-${NAME}", port=3),
+    )
+    plain = _OuterVarModel(name="plain", inner=_InnerVarModel(host="z"))
+    model.set_var_context({"NAME": "bob"})
+
+    assert model.name == "bob"
+    assert model.inner.host == "h-bob"
+    assert model.inner.port == 3
+    assert plain.name == "plain"
+    assert plain.inner.host == "z"
+
+    model.name = "alice"
+    assert model.name == "alice"
+    assert model.inner.host == "h-alice"
+    assert model._var_env is not None
+    assert model._var_env.vars_map == {"NAME": "alice"}
+
+
+def test_render_template_resolves_each_name_once() -> None:
+    calls: list[str] = []
+
+    def resolve(name: str) -> str:
+        calls.append(name)
+        return name.lower()
+
+    tokens = vars_mod._compile_template("${A}/${B}/${A}/${env:A}")
+
+    assert vars_mod._render_template(tokens, resolve) == "a/b/a/env:a"
+    assert calls == ["A", "B", "env:A"]
+
+
+def test_var_field_names_skip_inert_fields() -> None:
+    assert vars_mod._var_field_names(_InnerVarModel) == ("host",)
+    assert vars_mod._var_field_names(_OuterVarModel) == ("name", "inner")
+
+
+class _ListVarModel(vars_mod.BaseVarModel):
+    items: list[str]
+    children: list[_InnerVarModel]
+
+
+def test_set_var_context_keeps_containers_in_place() -> None:
+    model = _ListVarModel(
+        items=["${NAME}", "plain"],
+        children=[_InnerVarModel(host="${NAME}")],
+    )
+    items = model.items
+    children = model.children
+    model.set_var_context({"NAME": "bob"})
+
+    assert model.items is items
+    assert model.children is children
+    assert model.children[0].host == "bob"
+
+
+class _ParentVarModel(vars_mod.BaseVarModel):
+    name: str
+
+
+def test_subclass_after_set_var_context_keeps_required_fields() -> None:
+    parent = _ParentVarModel(name="${NAME}")
+    parent.set_var_context({"NAME": "bob"})
+
+    class _ChildVarModel(_ParentVarModel):
+        extra: int = 0
+
+    assert parent.name == "bob"
+    assert _ChildVarModel.model_fields["name"].is_required()
+    with pytest.raises(pydantic.ValidationError):
+        _ChildVarModel()
+    assert _ChildVarModel(name="x").name == "x"
+
+
+def test_wrap_value_classifies_strings() -> None:
+    env = vars_mod.VarEnv({"A": "one"})
+    wrap = vars_mod.BaseVarModel._wrap_value
+
+    assert isinstance(wrap("${A}", env), vars_mod.VarRef)
+    assert isinstance(wrap("x ${A}", env), vars_mod.VarInterpolated)
+    assert isinstance(wrap("${A}${A}", env), vars_mod.VarInterpolated)
+    assert wrap("plain", env) == "plain"
+    assert wrap("$${A}", env) == "$${A}"
+    assert wrap(3, env) == 3
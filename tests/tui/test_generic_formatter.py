@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from vocode.tui.tcf import generic as generic_tcf
+
+
+def test_generic_formatter_reuses_render_for_same_call() -> None:
+    formatter = generic_tcf.GenericToolCallFormatter()
+    arguments = {"path": "a.py", "limit": 3}
+
+    first = formatter._render_argument_pairs("call_1", arguments, 6, 80)
+    second = formatter._render_argument_pairs("call_1", arguments, 6, 80)
+    other = formatter._render_argument_pairs("call_2", {"path": "b.py"}, 6, 80)
+
+    assert first == [("path", "a.py"), ("limit", "3")]
+    assert second is first
+    assert other == [("path", "b.py")]
+
+
+def test_generic_formatter_rerenders_when_limits_change() -> None:
+    formatter = generic_tcf.GenericToolCallFormatter()
+    arguments = {"path": "a" * 20, "limit": 3}
+
+    full = formatter._render_argument_pairs("call_1", arguments, 6, 80)
+    fewer_pairs = formatter._render_argument_pairs("call_1", arguments, 1, 80)
+    shorter_values = formatter._render_argument_pairs("call_1", arguments, 6, 10)
+
+    assert full == [("path", "a" * 20), ("limit", "3")]
+    assert fewer_pairs == [("path", "a" * 20)]
+    assert shorter_values == [("path", "a" * 7 + "..."), ("limit", "3")]
+    assert formatter._render_argument_pairs("call_1", arguments, 6, 80) is full
+
+
+def test_generic_formatter_skips_cache_without_call_id() -> None:
+    formatter = generic_tcf.GenericToolCallFormatter()
+
+    formatter._render_argument_pairs("", {"path": "a.py"}, 6, 80)
+
+    assert formatter._rendered_arguments == {}
@@ -335,7 +335,7 @@ async def test_tui_state_paste_inserts_without_submit() -> None:
     event = input_base.PasteEvent(text=paste_text)
     state._handle_input_event(event)
 
-    component = state._input_component
+    component = state.input_component
     assert component.text == paste_text
     assert called == []
 
@@ -563,7 +563,7 @@ async def test_tui_state_input_history_navigation() -> None:
         on_stop=None,
         on_eof=None,
     )
-    component = state._input_component
+    component = state.input_component
 
     state._handle_submit("first")
     state._handle_submit("second")
@@ -1347,6 +1347,34 @@ async def test_tui_state_ctrl_c_triggers_on_stop() -> None:
     assert called
 
 
+@pytest.mark.asyncio
+async def test_tui_state_ctrl_c_calls_sync_on_stop_directly() -> None:
+    async def on_input(_: str) -> None:
+        return
+
+    class DummyInputHandler(input_base.InputHandler):
+        async def run(self) -> None:
+            return
+
+    called: list[object] = []
+
+    def on_stop() -> None:
+        called.append(object())
+
+    ui_state = tui_uistate.TUIState(
+        on_input=on_input,
+        console=None,
+        input_handler=DummyInputHandler(),
+        on_autocomplete_request=None,
+        on_stop=on_stop,
+        on_eof=None,
+    )
+    event = input_base.KeyEvent(action="down", key="c", ctrl=True)
+    ui_state._input_handler.publish(event)
+    assert called
+    assert not ui_state._callback_tasks
+
+
 @pytest.mark.asyncio
 async def test_tui_state_ctrl_dot_collapses_last_messages_progressively() -> None:
     async def on_input(_: str) -> None:
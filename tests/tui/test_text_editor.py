@@ -195,4 +195,17 @@ def test_set_cursor_position_clamps_within_bounds() -> None:
     assert editor.cursor_col == 0
     editor.set_cursor_position(10, 10)
     assert editor.cursor_row == 1
-    assert editor.cursor_col == len("two")
\ No newline at end of file
+    assert editor.cursor_col == len("two")
+
+
+def test_replace_range_splices_line_and_moves_cursor() -> None:
+    editor = components_text_editor.TextEditor("first\nsay /he now\nlast")
+    editor.replace_range(1, 4, 7, "/help")
+    assert editor.lines == ["first", "say /help now", "last"]
+    assert editor.cursor_row == 1
+    assert editor.cursor_col == 9
+
+    editor.replace_range(1, 4, 9, "a\nb")
+    assert editor.lines == ["first", "say a", "b now", "last"]
+    assert editor.cursor_row == 2
+    assert editor.cursor_col == 1
@@ -385,7 +385,7 @@ def test_autocomplete_ctrl_n_p_activate_and_navigate() -> None:
 
 def test_autocomplete_tab_activates_then_accepts() -> None:
     ui_state = _make_tui_state_with_console()
-    input_component = ui_state._input_component
+    input_component = ui_state.input_component
     input_component.text = "he"
     input_component.set_cursor_position(0, 2)
 
@@ -430,7 +430,7 @@ def test_history_search_shows_matches_and_accepts() -> None:
     ui_state.history.add("echo hello")
     ui_state.history.add("echo world")
 
-    input_component = ui_state._input_component
+    input_component = ui_state.input_component
     input_component.text = "draft"
     input_component.set_cursor_position(0, 5)
 
@@ -487,7 +487,7 @@ def test_history_search_displays_only_first_line_and_keeps_full_value() -> None:
     ui_state = _make_tui_state_with_console()
     ui_state.history.add("echo hello\nsecond line")
 
-    input_component = ui_state._input_component
+    input_component = ui_state.input_component
     input_component.text = ""
     input_component.set_cursor_position(0, 0)
 
@@ -535,7 +535,7 @@ def test_history_search_escape_keeps_original_buffer() -> None:
     ui_state.history.add("one")
     ui_state.history.add("two")
 
-    input_component = ui_state._input_component
+    input_component = ui_state.input_component
     input_component.text = "draft"
     input_component.set_cursor_position(0, 3)
 